@@ -0,0 +1,36 @@
+import tkinter as tk
+import tkinter.font as tkfont
+
+import yaml
+
+# Use the libyaml-backed loader if available (much faster than the pure Python loader)
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+
+# Shared named fonts for the GUI labels, keyed by the font size. Each font is created
+# once (after the root window exists) by `named_font()` so that every label of the
+# applications references the same Tk font.
+_NAMED_FONTS = {}
+
+def named_font(root: tk.Misc, size: int) -> tkfont.Font:
+    '''
+    Returns the shared Helvetica font of the given `size`, creating it for `root` on
+    the first call.
+    '''
+    font = _NAMED_FONTS.get(size)
+    if font is None:
+        font = tkfont.Font(root=root, family='Helvetica', size=size)
+        _NAMED_FONTS[size] = font
+    return font
+
+def load_yaml(path):
+    '''
+    Returns the YAML config at `path` as a nested dict. The `path` can be either a
+    filesystem path or a `Traversable` resource (as returned by `importlib.resources`),
+    resources are opened directly so that they need not be extracted to a file.
+    '''
+    with (path.open('r') if hasattr(path, 'open') else open(path, 'r')) as file:
+        return yaml.load(file, Loader=_YAMLLoader)
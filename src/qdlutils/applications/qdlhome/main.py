@@ -1,11 +1,7 @@
+import importlib
 import logging
 import tkinter as tk
 
-import qdlutils.applications.qdlmove.main as qdlmove
-import qdlutils.applications.qdlple.main as qdlple
-import qdlutils.applications.qdlscan.main as qdlscan
-import qdlutils.applications.qdlscope.main as qdlscope
-
 logger = logging.getLogger(__name__)
 logging.basicConfig()
 
@@ -41,14 +37,17 @@ class HomeApplication:
     def __init__(self):
         # Initialize the root tkinter widget (window housing GUI)
         self.root = tk.Tk()
-        # Create the main application GUI
-        self.view = HomeApplicationView(main_window=self.root)
-
-        # Bind the buttons in the GUI
-        self.view.qdlmove_button.bind('<Button>', self.open_qdlmove)
-        self.view.qdlple_button.bind('<Button>', self.open_qdlple)
-        self.view.qdlscan_button.bind('<Button>', self.open_qdlscan)
-        self.view.qdlscope_button.bind('<Button>', self.open_qdlscope)
+        # Create the main application GUI and bind the buttons
+        self.view = HomeApplicationView(main_window=self.root,
+                                        qdlmove_cmd=self.open_qdlmove,
+                                        qdlple_cmd=self.open_qdlple,
+                                        qdlscan_cmd=self.open_qdlscan,
+                                        qdlscope_cmd=self.open_qdlscope)
+
+        # Dictionary of launched applications, keyed by the application name. Each
+        # application is constructed on the first launch and then hidden/revealed on
+        # subsequent launches instead of being rebuilt from scratch.
+        self._apps = {}
 
     def run(self) -> None:
         '''
@@ -61,34 +60,55 @@ class HomeApplication:
         # Launch the main loop
         self.root.mainloop()
 
-    def open_qdlmove(self, tkinter_event=None) -> None:
+    def _launch(self, key: str, module_path: str) -> None:
+        '''
+        Launches the application `key` by calling the `main()` function of the module
+        at `module_path` or, if the application has already been launched in this
+        session, raises the existing window. The module is imported on the first launch.
+
+        Closing a launched application window only hides it so that the hardware and
+        GUI do not need to be reinitialized on the next launch.
+        '''
+        app = self._apps.get(key)
+        # Reuse the existing application if the window is still alive
+        if (app is not None) and app.root.winfo_exists():
+            logger.info(f'Raising {key}...')
+            app.root.deiconify()
+            app.root.lift()
+            return
+        logger.info(f'Launching {key}...')
+        # The applications are only imported when first launched to avoid loading the
+        # full hardware/plotting stack of every application at startup.
+        module = importlib.import_module(module_path)
+        # Launches the application as a subprocess (the application opens a
+        # tk.Toplevel instead of a tk.Tk (root) window). The software also skips
+        # some steps that are necessary if running as the root.
+        app = module.main(is_root_process=False)
+        # Hide the window on close instead of destroying it
+        app.root.protocol('WM_DELETE_WINDOW', app.root.withdraw)
+        self._apps[key] = app
+
+    def open_qdlmove(self) -> None:
         try:
-            logger.info('Launching qdlmove...')
-            # Launches the application as a subprocess (the application opens a
-            # tk.Toplevel instead of a tk.Tk (root) window). The software also skips
-            # some steps that are necessary if running as the root.
-            qdlmove.main(is_root_process=False)
+            self._launch('qdlmove', 'qdlutils.applications.qdlmove.main')
         except Exception as e:
             logger.warning(f'{e}')
 
-    def open_qdlple(self, tkinter_event=None) -> None:
+    def open_qdlple(self) -> None:
         try:
-            logger.info('Launching qdlple...')
-            qdlple.main(is_root_process=False)
+            self._launch('qdlple', 'qdlutils.applications.qdlple.main')
         except Exception as e:
             logger.warning(f'{e}')
 
-    def open_qdlscan(self, tkinter_event=None) -> None:
+    def open_qdlscan(self) -> None:
         try:
-            logger.info('Launching qdlscan...')
-            qdlscan.main(is_root_process=False)
+            self._launch('qdlscan', 'qdlutils.applications.qdlscan.main')
         except Exception as e:
             logger.warning(f'{e}')
 
-    def open_qdlscope(self, tkinter_event=None) -> None:
+    def open_qdlscope(self) -> None:
         try:
-            logger.info('Launching qdlscope...')
-            qdlscope.main(is_root_process=False)
+            self._launch('qdlscope', 'qdlutils.applications.qdlscope.main')
         except Exception as e:
             logger.warning(f'{e}')
 
@@ -97,7 +117,12 @@ class HomeApplicationView:
     '''
     Main application GUI view
     '''
-    def __init__(self, main_window: tk.Tk) -> None:
+    def __init__(self, 
+                 main_window: tk.Tk, 
+                 qdlmove_cmd=None, 
+                 qdlple_cmd=None, 
+                 qdlscan_cmd=None, 
+                 qdlscope_cmd=None) -> None:
         main_frame = tk.Frame(main_window)
         main_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=40, pady=30)
 
@@ -111,16 +136,16 @@ class HomeApplicationView:
                  font='Helvetica 14').grid(row=row, column=0, pady=[0,5], columnspan=2)
         # Start buttons
         row += 1
-        self.qdlmove_button = tk.Button(app_frame, text='qdlmove', width=20)
+        self.qdlmove_button = tk.Button(app_frame, text='qdlmove', width=20, command=qdlmove_cmd)
         self.qdlmove_button.grid(row=row, column=0, columnspan=2, pady=5)
         row += 1
-        self.qdlple_button = tk.Button(app_frame, text='qdlple', width=20)
+        self.qdlple_button = tk.Button(app_frame, text='qdlple', width=20, command=qdlple_cmd)
         self.qdlple_button.grid(row=row, column=0, columnspan=2, pady=5)
         row += 1
-        self.qdlscan_button = tk.Button(app_frame, text='qdlscan', width=20) 
+        self.qdlscan_button = tk.Button(app_frame, text='qdlscan', width=20, command=qdlscan_cmd)
         self.qdlscan_button.grid(row=row, column=0, columnspan=2, pady=5)
         row += 1
-        self.qdlscope_button = tk.Button(app_frame, text='qdlscope', width=20)
+        self.qdlscope_button = tk.Button(app_frame, text='qdlscope', width=20, command=qdlscope_cmd)
         self.qdlscope_button.grid(row=row, column=0, columnspan=2, pady=5)
 
 def main():
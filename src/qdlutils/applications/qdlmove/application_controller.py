@@ -1,39 +1,35 @@
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 
 class MovementController:
     '''
     This is a basic application controller backend for the `qdlmove` application.
-    In its current implementation, it manages calls to move or step the various 
+    In its current implementation, it manages calls to move or step the various
     hardware by reference to their name as stored in the `self.positioners` dict.
-    
-    In the future, if more features are desired of the `qdlmove` application, 
+
+    Calls to the hardware are submitted to a single worker thread so that the GUI
+    remains responsive while the hardware is moving. Since there is only one worker,
+    the calls are executed serially in the order in which they were submitted.
+    The `move_axis` and `step_axis` methods return the corresponding `Future`.
+
+    In the future, if more features are desired of the `qdlmove` application,
     for example recording/saving of positions, plotting points, etc. the developer
     should add these features into this class and update the GUI/main application
     to trigger methods or store data in this class.
     '''
     def __init__(self, positioners: dict = {}):
         self.positioners = positioners # dictionary of the controller instantiations
-        self.busy = False
+        # Single worker thread which serializes access to the hardware
+        self._pool = ThreadPoolExecutor(max_workers=1)
 
 
-    def move_axis(self, axis_controller_name: str, position: float):
-        if self.busy:
-            logger.warning('Movement controller busy')
-            return None
-        self.busy = True
+    def move_axis(self, axis_controller_name: str, position: float) -> Future:
         # Move the axis specified by the axis_controller_name
-        self.positioners[axis_controller_name].go_to_position(position)
-        self.busy = False
-
-    def step_axis(self, axis_controller_name: str, dx: float):
-        if self.busy:
-            logger.warning('Movement controller busy')
-            return None
-        self.busy = True
+        return self._pool.submit(self.positioners[axis_controller_name].go_to_position, position)
+
+    def step_axis(self, axis_controller_name: str, dx: float) -> Future:
         # Step the axis specified by the axis_controller_name
-        self.positioners[axis_controller_name].step_position(dx)
-        self.busy = False
\ No newline at end of file
+        return self._pool.submit(self.positioners[axis_controller_name].step_position, dx)
@@ -1,4 +1,8 @@
 import tkinter as tk
+from collections import namedtuple
+
+from qdlutils.applications.common import named_font
+
 
 class PositionControllerApplicationView():
     '''
@@ -18,15 +22,12 @@ class PositionControllerApplicationView():
         # This creates a GUI element for the specified axes with the provided names.
         # You must make a controller of the right type and with correct associations
         # in order for the GUI to work properly.
-        # self.micros_view = TwoAxisApplicationView(root_frame=frame, 
-        #                                           title='Micros', 
-        #                                           axis_1_label='X axis', 
-        #                                           axis_2_label='Y axis')
-        self.piezos_view = ThreeAxisApplicationView(root_frame=frame, 
-                                                    title='Piezos', 
-                                                    axis_1_label='X axis', 
-                                                    axis_2_label='Y axis',
-                                                    axis_3_label='Z axis')
+        # self.micros_view = NAxisApplicationView(root_frame=frame, 
+        #                                         title='Micros', 
+        #                                         axis_labels=['X axis', 'Y axis'])
+        self.piezos_view = NAxisApplicationView(root_frame=frame, 
+                                                title='Piezos', 
+                                                axis_labels=['X axis', 'Y axis', 'Z axis'])
 
 
         # ===============================================================================
@@ -34,65 +35,16 @@ class PositionControllerApplicationView():
         # ===============================================================================
 
 
-class TwoAxisApplicationView():
-    '''
-    Application control for two-axis movement
-    '''
-    def __init__(self, root_frame: tk.Frame, title: str, axis_1_label: str, axis_2_label: str):
-        
-        # Frame to house this subwindow
-        self.base_frame = tk.Frame(root_frame)
-        self.base_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=4, pady=8)
+# Widgets of a single axis row in the `NAxisApplicationView`
+AxisView = namedtuple('AxisView', ['set_button', 'set_entry', 'step_entry', 'readout_entry', 'readout_var'])
 
 
-        row = 0
-        tk.Label(self.base_frame, text=title, font='Helvetica 14').grid(row=row, column=0, pady=[0,5], columnspan=5)
-        
-        row += 1
-        # Enable/disable the stepper
-        self.stepping_active = tk.IntVar()
-        self.stepping_laser_toggle = tk.Checkbutton ( self.base_frame, var=self.stepping_active, text='Enable stepping')
-        self.stepping_laser_toggle.grid(row=row, column=0, pady=[0,0], columnspan=2)
-        tk.Label(self.base_frame, text='Set value', font='Helvetica 10', width=10).grid(row=row, column=2, pady=[0,0], columnspan=1)
-        tk.Label(self.base_frame, text='Step', font='Helvetica 10', width=10).grid(row=row, column=3, pady=[0,0], columnspan=1)
-        tk.Label(self.base_frame, text='Current', font='Helvetica 10', width=10).grid(row=row, column=4, pady=[0,0], columnspan=1)
-
-        row += 1
-        tk.Label(self.base_frame, text=axis_1_label, font='Helvetica 10', width=10).grid(row=row, column=0, pady=[0,0], columnspan=1)
-        self.axis_1_set_button = tk.Button(self.base_frame, text='Set position', width=10)
-        self.axis_1_set_button.grid(row=row, column=1, columnspan=1, padx=0)
-        self.axis_1_set_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_1_set_entry.insert(0, 0)
-        self.axis_1_set_entry.grid(row=row, column=2)
-        self.axis_1_step_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_1_step_entry.insert(0, 0)
-        self.axis_1_step_entry.grid(row=row, column=3)
-        self.axis_1_readout_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_1_readout_entry.insert(0, 0)
-        self.axis_1_readout_entry.config(state='readonly')
-        self.axis_1_readout_entry.grid(row=row, column=4)
-
-        row += 1
-        tk.Label(self.base_frame, text=axis_2_label, font='Helvetica 10', width=10).grid(row=row, column=0, pady=[0,0], columnspan=1)
-        self.axis_2_set_button = tk.Button(self.base_frame, text='Set position', width=10)
-        self.axis_2_set_button.grid(row=row, column=1, columnspan=1, padx=0)
-        self.axis_2_set_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_2_set_entry.insert(0, 0)
-        self.axis_2_set_entry.grid(row=row, column=2)
-        self.axis_2_step_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_2_step_entry.insert(0, 0)
-        self.axis_2_step_entry.grid(row=row, column=3)
-        self.axis_2_readout_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_2_readout_entry.insert(0, 0)
-        self.axis_2_readout_entry.config(state='readonly')
-        self.axis_2_readout_entry.grid(row=row, column=4)
-
-
-class ThreeAxisApplicationView():
+class NAxisApplicationView():
     '''
-    Application control for two-axis movement
+    Application control for multi-axis movement. A row of widgets is created for each
+    label in `axis_labels` and stored in `self.axes` (in the same order) as `AxisView`.
     '''
-    def __init__(self, root_frame: tk.Frame, title: str, axis_1_label: str, axis_2_label: str, axis_3_label: str):
+    def __init__(self, root_frame: tk.Frame, title: str, axis_labels: list):
         
         # Frame to house this subwindow
         self.base_frame = tk.Frame(root_frame)
@@ -100,58 +52,34 @@ class ThreeAxisApplicationView():
 
 
         row = 0
-        tk.Label(self.base_frame, text=title, font='Helvetica 14').grid(row=row, column=0, pady=[0,5], columnspan=5)
+        tk.Label(self.base_frame, text=title, font=named_font(self.base_frame, 14)).grid(row=row, column=0, pady=[0,5], columnspan=5)
         
         row += 1
         # Enable/disable the stepper
         self.stepping_active = tk.IntVar()
         self.stepping_laser_toggle = tk.Checkbutton ( self.base_frame, var=self.stepping_active, text='Enable stepping')
         self.stepping_laser_toggle.grid(row=row, column=0, pady=[0,0], columnspan=2)
-        tk.Label(self.base_frame, text='Set value', font='Helvetica 10', width=10).grid(row=row, column=2, pady=[0,0], columnspan=1)
-        tk.Label(self.base_frame, text='Step', font='Helvetica 10', width=10).grid(row=row, column=3, pady=[0,0], columnspan=1)
-        tk.Label(self.base_frame, text='Current', font='Helvetica 10', width=10).grid(row=row, column=4, pady=[0,0], columnspan=1)
-
-        row += 1
-        tk.Label(self.base_frame, text=axis_1_label, font='Helvetica 10', width=10).grid(row=row, column=0, pady=[0,0], columnspan=1)
-        self.axis_1_set_button = tk.Button(self.base_frame, text='Set position', width=10)
-        self.axis_1_set_button.grid(row=row, column=1, columnspan=1, padx=0)
-        self.axis_1_set_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_1_set_entry.insert(0, 0)
-        self.axis_1_set_entry.grid(row=row, column=2)
-        self.axis_1_step_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_1_step_entry.insert(0, 0)
-        self.axis_1_step_entry.grid(row=row, column=3)
-        self.axis_1_readout_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_1_readout_entry.insert(0, 0)
-        self.axis_1_readout_entry.config(state='readonly')
-        self.axis_1_readout_entry.grid(row=row, column=4)
-
-        row += 1
-        tk.Label(self.base_frame, text=axis_2_label, font='Helvetica 10', width=10).grid(row=row, column=0, pady=[0,0], columnspan=1)
-        self.axis_2_set_button = tk.Button(self.base_frame, text='Set position', width=10)
-        self.axis_2_set_button.grid(row=row, column=1, columnspan=1, padx=0)
-        self.axis_2_set_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_2_set_entry.insert(0, 0)
-        self.axis_2_set_entry.grid(row=row, column=2)
-        self.axis_2_step_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_2_step_entry.insert(0, 0)
-        self.axis_2_step_entry.grid(row=row, column=3)
-        self.axis_2_readout_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_2_readout_entry.insert(0, 0)
-        self.axis_2_readout_entry.config(state='readonly')
-        self.axis_2_readout_entry.grid(row=row, column=4)
+        for column, text in enumerate(['Set value', 'Step', 'Current'], start=2):
+            tk.Label(self.base_frame, text=text, font=named_font(self.base_frame, 10), width=10).grid(row=row, column=column, pady=[0,0], columnspan=1)
 
         row += 1
-        tk.Label(self.base_frame, text=axis_3_label, font='Helvetica 10', width=10).grid(row=row, column=0, pady=[0,0], columnspan=1)
-        self.axis_3_set_button = tk.Button(self.base_frame, text='Set position', width=10)
-        self.axis_3_set_button.grid(row=row, column=1, columnspan=1, padx=0)
-        self.axis_3_set_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_3_set_entry.insert(0, 0)
-        self.axis_3_set_entry.grid(row=row, column=2)
-        self.axis_3_step_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_3_step_entry.insert(0, 0)
-        self.axis_3_step_entry.grid(row=row, column=3)
-        self.axis_3_readout_entry = tk.Entry(self.base_frame, width=10)
-        self.axis_3_readout_entry.insert(0, 0)
-        self.axis_3_readout_entry.config(state='readonly')
-        self.axis_3_readout_entry.grid(row=row, column=4)
\ No newline at end of file
+        # Create a row of widgets for each axis
+        self.axes = [self._build_axis_row(row=row+i, label=label) for i, label in enumerate(axis_labels)]
+
+    def _build_axis_row(self, row: int, label: str) -> AxisView:
+        '''
+        Creates the label, set button and entries for a single axis on the given row
+        '''
+        tk.Label(self.base_frame, text=label, font=named_font(self.base_frame, 10), width=10).grid(row=row, column=0, pady=[0,0], columnspan=1)
+        set_button = tk.Button(self.base_frame, text='Set position', width=10)
+        set_button.grid(row=row, column=1, columnspan=1, padx=0)
+        # Set and step entries start at zero
+        set_entry, step_entry = [tk.Entry(self.base_frame, width=10) for _ in range(2)]
+        for column, entry in enumerate([set_entry, step_entry], start=2):
+            entry.insert(0, 0)
+            entry.grid(row=row, column=column)
+        # The readout is updated through its text variable so that it can remain readonly
+        readout_var = tk.StringVar(self.base_frame, value='0')
+        readout_entry = tk.Entry(self.base_frame, width=10, textvariable=readout_var, state='readonly')
+        readout_entry.grid(row=row, column=4)
+        return AxisView(set_button, set_entry, step_entry, readout_entry, readout_var)
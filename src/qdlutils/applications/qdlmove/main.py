@@ -1,29 +1,78 @@
+import functools
 import importlib
 import importlib.resources
 import logging
+import os
+import sys
+from concurrent.futures import Future
+from dataclasses import dataclass
 
 import tkinter as tk
-import yaml
 
+from qdlutils.applications.common import load_yaml
 from qdlutils.applications.qdlmove.application_gui import (
     PositionControllerApplicationView, 
-    TwoAxisApplicationView, 
-    ThreeAxisApplicationView
+    NAxisApplicationView
     )
 from qdlutils.applications.qdlmove.application_controller import MovementController
 
-from qdlutils.hardware.micrometers.newportmicrometer import NewportMicrometer
-from qdlutils.hardware.nidaq.analogoutputs.nidaqposition import NidaqPositionController
-
 
 logger = logging.getLogger(__name__)
-logging.basicConfig()
 
 
 CONFIG_PATH = 'qdlutils.applications.qdlmove.config_files'
 DEFAULT_CONFIG_FILE = 'qdlmove_base.yaml'
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_ctor(import_path: str, class_name: str):
+    '''
+    Returns the class constructor `class_name` from the module at `import_path`.
+    The result is cached so that reloading the configuration skips the import, and
+    modules which have already been imported are taken directly from `sys.modules`.
+    '''
+    module = sys.modules.get(import_path)
+    if module is None:
+        logger.debug('Importing %s', import_path)
+        module = importlib.import_module(import_path)
+    return getattr(module, class_name)
+
+
+@dataclass(frozen=True)
+class PositionerSpec:
+    '''
+    Specification of a single positioner as parsed from the YAML config.
+    '''
+    name: str
+    import_path: str
+    class_name: str
+    configure: tuple    # (key, value) pairs of the `configure` dictionary
+
+
+def _parse_specs(config: dict) -> tuple:
+    '''
+    Parses the YAML `config` (as a nested dict) into a tuple of `PositionerSpec`, one
+    for each positioner listed under `Positioners` (in the same order).
+    '''
+    # First we get the top level application name
+    app_config = config[next(iter(config))]
+    return tuple(
+        PositionerSpec(name=positioner_name,
+                       import_path=app_config[positioner_name]['import_path'],
+                       class_name=app_config[positioner_name]['class_name'],
+                       configure=tuple(app_config[positioner_name]['configure'].items()))
+        for positioner_name in app_config['Positioners'])
+
+@functools.lru_cache(maxsize=8)
+def _load_specs(path: str, mtime: int) -> tuple:
+    '''
+    Returns the `PositionerSpec` tuple of the YAML config at `path`. The result is
+    cached on the file path and modification time `mtime` so that reloading an
+    unmodified file skips reading and parsing it.
+    '''
+    return _parse_specs(load_yaml(path))
+
+
 class PositionControllerApplication():
     '''
     The main position controller application logic which coordinates the GUI inputs with
@@ -48,6 +97,8 @@ class PositionControllerApplication():
 
         self.positioners = {}
         self.application_controller = None
+        # Movement controller with stepping currently enabled (at most one at a time)
+        self.active_stepper = None
 
         # Load the YAML configuration file
         self.load_yaml_from_name(yaml_filename=default_config_filename)
@@ -88,15 +139,14 @@ class PositionControllerApplication():
                                     read_precision=2)
         
         # 4. ADD THOSE CONTROLLERS TO THIS LIST
-        # This list is used to keep track of the controllers to ensure that the stepping
-        # does not overlap.
+        # This list is used to keep track of the controllers in the application.
         self.movement_controllers = [#self.micros_application,
                                      self.piezos_application,]
         
         # 5. ADD LOGIC FOR NEW TYPES OF HARDWARE
         # If you are using new hardware types (i.e. not `nidaqpizeo` or 
         # `newportmicrometer`) then you need to add logic for their start up to the 
-        # `__init__` methods of TwoAxisApplicationControl and ThreesAxisApplicationControl
+        # `POSITIONER_STARTUP` table defined above TwoAxisApplicationControl
 
         # ===============================================================================
         # No edits below here!
@@ -105,42 +155,37 @@ class PositionControllerApplication():
         # Set the focus to the root when hitting enter
         self.root.bind('<Return>', self.refocus)
 
-    def configure_from_yaml(self, afile: str) -> None:
+    def configure_from_yaml(self, afile) -> None:
         '''
         This method loads a YAML file to configure the qdlmove hardware
-        based on yaml file indicated by argument `afile`.
+        based on yaml file indicated by argument `afile`, which can be either
+        a path or a `Traversable` resource (as returned by `importlib.resources`).
 
         This method constructs the positioners and configures them, then
         stores them in a dictionary which is saved in the application.
         '''
-        with open(afile, 'r') as file:
-            # Log selection
-            logger.info(f"Loading settings from: {afile}")
-            # Get the YAML config as a nested dict
-            config = yaml.safe_load(file)
-
-        # First we get the top level application name
-        APPLICATION_NAME = list(config.keys())[0]
-
-        # Get the names of the positioners as a list
-        positioner_names = list(config[APPLICATION_NAME]['Positioners'])
+        # Log selection
+        logger.info('Loading settings from: %s', afile)
+        # Reuse the parsed config if the file has not been modified since last parsed.
+        # Resources which are not on the filesystem (e.g. in a zip) are not cached.
+        try:
+            mtime = os.stat(afile).st_mtime_ns
+        except (TypeError, OSError):
+            mtime = None
+        if mtime is not None:
+            specs = _load_specs(str(afile), mtime)
+        else:
+            specs = _parse_specs(load_yaml(afile))
 
         # For each positioner, get the class constructor, instantiate, then configure
-        for positioner_name in positioner_names:
-
-            # Get the path and the name of the class
-            import_path = config[APPLICATION_NAME][positioner_name]['import_path']
-            class_name = config[APPLICATION_NAME][positioner_name]['class_name']
-            #Load the class
-            module = importlib.import_module(import_path)
-            logger.debug(f"Importing {import_path}")
-            # Get the class constructor
-            constructor = getattr(module, class_name)
+        for spec in specs:
+            # Get the class constructor from the path and the name of the class
+            constructor = _resolve_ctor(spec.import_path, spec.class_name)
             # Instantiate a positioner class and configure it
             positioner = constructor()
-            positioner.configure(config[APPLICATION_NAME][positioner_name]['configure'])
+            positioner.configure(dict(spec.configure))
             # Save to positioners dictionary
-            self.positioners[positioner_name] = positioner
+            self.positioners[spec.name] = positioner
 
 
     def load_yaml_from_name(self, yaml_filename: str) -> None:
@@ -151,7 +196,7 @@ class PositionControllerApplication():
         function for the support controller pull-down menu in the side panel
         '''
         yaml_path = importlib.resources.files(CONFIG_PATH).joinpath(yaml_filename)
-        self.configure_from_yaml(str(yaml_path))
+        self.configure_from_yaml(yaml_path)
 
     def refocus(self, tkinter_event=None):
         '''
@@ -160,11 +205,35 @@ class PositionControllerApplication():
         cursor from any entry widgets, enabling movement with keys without unintended
         input into the entry widgets.
         '''
-        logger.debug('Refocus triggered.')
-        if tkinter_event.keysym == 'Return':
-            logger.debug('Refocused successfully.')
-            self.root.focus_set()
-
+        # Only bound to <Return> so there is no need to check the key
+        self.root.focus_set()
+
+    def when_done(self, 
+                  future: Future, 
+                  callback, 
+                  poll_interval: int=5, 
+                  max_poll_interval: int=100) -> None:
+        '''
+        Polls the `future` returned by the application controller from the tkinter event
+        loop and calls `callback` once it completes. This keeps the GUI responsive while
+        the hardware is moving.
+
+        The polling starts at `poll_interval` milliseconds so that short movements (e.g.
+        single steps) update the readout quickly, then doubles on each poll up to
+        `max_poll_interval` so that long movements do not wake the event loop needlessly.
+        '''
+        if not future.done():
+            self.root.after(poll_interval, 
+                            self.when_done, 
+                            future, 
+                            callback, 
+                            min(2*poll_interval, max_poll_interval), 
+                            max_poll_interval)
+            return
+        # Report errors raised by the hardware in the worker thread
+        if future.exception() is not None:
+            logger.warning('%s', future.exception())
+        callback()
 
     def run(self) -> None:
         '''
@@ -179,63 +248,123 @@ class PositionControllerApplication():
             self.root.mainloop()
 
 
+def _startup_nidaq(control, axis_controller_name: str, set_entry: tk.Entry, set_axis) -> None:
+    '''
+    Startup logic for `NidaqPositionController` axes.
+    '''
+    # Initialize the value to zero on start up
+    # Initial value in GUI for step is zero so setting the axis sets it to zero
+    set_axis()
 
-class TwoAxisApplicationControl():
+def _startup_micrometer(control, axis_controller_name: str, set_entry: tk.Entry, set_axis) -> None:
     '''
-    Application controller for two axis movement
+    Startup logic for `NewportMicrometer` axes.
+    '''
+    # Annoyingly we need to read the current position directly, place it in the GUI,
+    # then set the position.
+    current_position = control.parent.positioners[axis_controller_name].read_position()
+    # Set the entry in the gui
+    set_entry.delete(0, 'end')
+    set_entry.insert(0, f'{current_position:.{control.read_precision}f}')
+    # Set the gui position
+    set_axis()
+
+# Startup function for each type of positioner, called by the application controls with
+# arguments (control, axis_controller_name, set_entry, set_axis) for each axis.
+# The positioner types are identified by their full `import_path.class_name` (as in the
+# YAML config) so that the hardware modules are only imported if they are configured.
+# Subclasses of these types use the startup of their closest listed base class.
+# ===============================================================================
+# Add more startup logic for new types of hardware here if needed
+# ===============================================================================
+POSITIONER_STARTUP = {
+    'qdlutils.hardware.nidaq.analogoutputs.nidaqposition.NidaqPositionController': _startup_nidaq,
+    'qdlutils.hardware.micrometers.newportmicrometer.NewportMicrometer': _startup_micrometer,
+}
+
+def _find_startup(positioner_type: type):
+    '''
+    Returns the `POSITIONER_STARTUP` function for `positioner_type` or any of its base
+    classes (in method resolution order), or None if there is no startup function.
+    '''
+    for cls in positioner_type.__mro__:
+        startup = POSITIONER_STARTUP.get(f'{cls.__module__}.{cls.__qualname__}')
+        if startup is not None:
+            return startup
+    return None
+
+def _make_readout(positioner, readout_var: tk.StringVar, read_precision: int):
     '''
+    Returns a function which updates `readout_var` with the last write value of the
+    `positioner`, formatted with `read_precision` decimals.
+    '''
+    fmt = f'{{:.{read_precision}f}}'.format
+    def update_readout():
+        readout_var.set(fmt(positioner.last_write_value))
+    return update_readout
+
+
+class AxisApplicationControl():
+    '''
+    Base application controller for multi-axis movement. The logic for setting,
+    stepping, and reading out the axes is shared by all axes and is parameterized by the
+    axis index `axis_idx`, which corresponds to the order of the axes in the GUI.
+
+    Subclasses define the key bindings for stepping in `KEY_BINDINGS`, a dictionary
+    mapping the tkinter event sequence to the (`axis_idx`, `sign`) of the step.
+    '''
+
+    KEY_BINDINGS = {}
+    # Time in milliseconds over which repeated step events are combined into one step
+    STEP_INTERVAL = 20
 
     def __init__(self,
                  parent: PositionControllerApplication,
-                 gui: TwoAxisApplicationView,
-                 axis_1_controller_name: str,
-                 axis_2_controller_name: str, 
+                 gui: NAxisApplicationView,
+                 axis_controller_names: list,
                  read_precision: int=1):
-        
-        # Save the controller names for each axis
+
         self.parent = parent
         self.gui = gui
-        self.axis_1_controller_name = axis_1_controller_name
-        self.axis_2_controller_name = axis_2_controller_name
         self.read_precision = read_precision
 
-        # Bind keys to the parent application view
+        # Cache the movement methods of the application controller
+        application_controller = self.parent.application_controller
+        self._move = application_controller.move_axis
+        self._step = application_controller.step_axis
+        positioners = application_controller.positioners
+        # Net step of each axis (by index) waiting to be sent to the hardware, and the
+        # id of the scheduled `_flush_steps()` call
+        self._pending_dx = {}
+        self._step_job = None
+        # (sequence, function id) of the active stepping key bindings on the root
+        self._bindings = []
+        # For each axis store (controller name, set entry, step entry, readout variable)
+        self._axes = [(axis_controller_name, axis_view.set_entry, axis_view.step_entry, axis_view.readout_var)
+                      for axis_controller_name, axis_view in zip(axis_controller_names, self.gui.axes)]
+        # Positioner of each axis
+        self._positioner = [positioners[axis_controller_name] for axis_controller_name in axis_controller_names]
+        # Readout update and set position callbacks for each axis
+        self._update_readout = [_make_readout(positioner, readout_var, read_precision)
+                                for positioner, (_, _, _, readout_var) in zip(self._positioner, self._axes)]
+        self._setters = [functools.partial(self.set_axis, axis_idx) for axis_idx in range(len(self._axes))]
+
+        # Bind buttons
         self.gui.stepping_laser_toggle.config(command=self.toggle_stepping)
-        self.gui.axis_1_set_button.bind("<Button>", self.set_axis_1)
-        self.gui.axis_2_set_button.bind("<Button>", self.set_axis_2)
+        for axis_view, set_axis in zip(self.gui.axes, self._setters):
+            axis_view.set_button.bind("<Button>", set_axis)
 
         # On startup the last write value of the positioners cannot generally be obtained
         # Unfortunately NIDAQ does not enable to to know the current set voltage of an AO
         # channel, but the serial micros enable readout of the current position.
         # Unfortunately, this means that stepping and the GUI readout is generally broken 
         # on startup. Thus we do some logic here to force an update on each of the axes.
-        # (there is probably a cleaner way of doing this).
-        # For each axis we check for the type of instance and then force an update depending
-        # on the type of hardware...
-        # If axis 1 is an NidaqPositionController...
-        if isinstance(self.parent.positioners[self.axis_1_controller_name], NidaqPositionController):
-            # Initialize the value to zero on start up
-            # Initial value in GUI for step is zero so setting the axis sets it to zero
-            self.set_axis_1()
-        # If axis 1 is a NewportMicrometer
-        if isinstance(self.parent.positioners[self.axis_1_controller_name], NewportMicrometer):
-            # Annoyingly we need to read the current position directly, place it in the GUI,
-            # then set the position.
-            current_position = round(self.parent.positioners[self.axis_1_controller_name].read_position(),self.read_precision)
-            # Set the entry in the gui
-            self.gui.axis_1_set_entry.insert(0, current_position)
-            # Set the gui position
-            self.set_axis_1()
-        # Repeat for axis 2
-        if isinstance(self.parent.positioners[self.axis_2_controller_name], NidaqPositionController):
-            self.set_axis_2()
-        if isinstance(self.parent.positioners[self.axis_2_controller_name], NewportMicrometer):
-            current_position = round(self.parent.positioners[self.axis_2_controller_name].read_position(),self.read_precision)
-            self.gui.axis_2_set_entry.insert(0, current_position)
-            self.set_axis_2()
-        # ===============================================================================
-        # Add more startup logic for new controllers here if needed
-        # ===============================================================================
+        # For each axis we look up the startup function for the type of hardware in
+        # `POSITIONER_STARTUP` and call it to force an update.
+        for axis_idx, (axis_controller_name, set_entry, _, _) in enumerate(self._axes):
+            startup = _find_startup(type(self._positioner[axis_idx]))
+            if startup is not None:
+                startup(self, axis_controller_name, set_entry, self._setters[axis_idx])
 
     def toggle_stepping(self):
         '''
@@ -244,333 +373,142 @@ class TwoAxisApplicationControl():
         '''
         # Check if the checkbox is checked in the GUI
         if (self.gui.stepping_active.get() == 1):
-            # Disable the other stepping checkboxes if they are active
-            for controller in self.parent.movement_controllers:
-                if controller is not self and (controller.gui.stepping_active.get()==1):
-                    # Uncheck the box
-                    controller.gui.stepping_active.set(0)
-                    # Toggle the stepping
-                    controller.toggle_stepping()
-            # Bind the keys to root
-            self.parent.root.bind('<Left>', self.step_axis_1)
-            self.parent.root.bind('<Right>', self.step_axis_1)
-            self.parent.root.bind('<Up>', self.step_axis_2)
-            self.parent.root.bind('<Down>', self.step_axis_2)
+            # Disable stepping on the other controller if it is active
+            active_stepper = self.parent.active_stepper
+            if (active_stepper is not None) and (active_stepper is not self):
+                # Uncheck the box
+                active_stepper.gui.stepping_active.set(0)
+                # Toggle the stepping
+                active_stepper.toggle_stepping()
+            self.parent.active_stepper = self
+            # Bind the keys to root, each key steps a single axis in a fixed direction
+            self._bindings = [
+                (sequence, self.parent.root.bind(sequence, functools.partial(self.step_axis, axis_idx, sign)))
+                for sequence, (axis_idx, sign) in self.KEY_BINDINGS.items()]
             logger.info('Stepping active.')
         else:
-            # Unbind all events tied to the root window
-            # except for the return key refocus
-            for event in self.parent.root.bind():
-                if event != '<Key-Return>':
-                    self.parent.root.unbind(event)
+            # Unbind the stepping keys bound above
+            for sequence, funcid in self._bindings:
+                self.parent.root.unbind(sequence, funcid)
+            self._bindings = []
+            if self.parent.active_stepper is self:
+                self.parent.active_stepper = None
             logger.info('Stepping inactive.')
 
-
-    # Call back functions for setting x,y positions and 
-    def set_axis_1(self, tkinter_event=None):
+    def _apply(self, axis_idx: int, position: float=None, dx: float=None):
         '''
-        Moves the axis 1 position to the value specified in the GUI
+        Moves the axis `axis_idx` to `position` if provided, otherwise steps it by `dx`,
+        then updates the readout once the movement is complete.
         '''
-        # Get the position from the GUI element
-        position = float(self.gui.axis_1_set_entry.get())
-        # Set the axis
-        self.parent.application_controller.move_axis(
-            axis_controller_name=self.axis_1_controller_name, 
-            position=position)
-        # Update the reader
-        self.gui.axis_1_readout_entry.config(state='normal')     
-        self.gui.axis_1_readout_entry.delete(0,'end')
-        self.gui.axis_1_readout_entry.insert(
-            0,round(self.parent.application_controller.positioners[self.axis_1_controller_name].last_write_value,
-                    self.read_precision))
-        self.gui.axis_1_readout_entry.config(state='readonly')
-
-    
-    def set_axis_2(self, tkinter_event=None):
+        axis_controller_name = self._axes[axis_idx][0]
+        if position is not None:
+            future = self._move(axis_controller_name=axis_controller_name, position=position)
+        else:
+            future = self._step(axis_controller_name=axis_controller_name, dx=dx)
+        # Update the reader once the movement is complete
+        self.parent.when_done(future, self._update_readout[axis_idx])
+
+    def set_axis(self, axis_idx: int, tkinter_event=None):
         '''
-        Moves the axis 2 position to the value specified in the GUI
+        Moves the axis `axis_idx` to the position specified in the GUI.
         '''
-        # Get the position from the GUI element
-        position = float(self.gui.axis_2_set_entry.get())
-        # Set the axis
-        self.parent.application_controller.move_axis(axis_controller_name=self.axis_2_controller_name, position=position)
-        # Update the reader
-        self.gui.axis_2_readout_entry.config(state='normal')     
-        self.gui.axis_2_readout_entry.delete(0,'end')
-        self.gui.axis_2_readout_entry.insert(
-            0,round(self.parent.application_controller.positioners[self.axis_2_controller_name].last_write_value,
-                    self.read_precision))
-        self.gui.axis_2_readout_entry.config(state='readonly')
-
-    def step_axis_1(self, tkinter_event=None):
+        self._apply(axis_idx, position=float(self._axes[axis_idx][1].get()))
+
+    def step_axis(self, axis_idx: int, sign: int, tkinter_event=None):
         '''
-        Steps the axis 1 position by the value specified in the GUI
-        with direction dependent on the key press
+        Steps the axis position by the value specified in the GUI in the direction `sign`.
+        Steps arriving within `STEP_INTERVAL` (e.g. from holding down a key) are summed
+        and sent to the hardware as a single step by `_flush_steps()`.
         '''
-        #if self.stepping_active:
-        # Get the position from the GUI element
-        dx = float(self.gui.axis_1_step_entry.get())
-        # Set the axis
-        if tkinter_event.keysym == 'Left':
-            logger.info(f'Moving Axis 1 left by {dx}')
-            self.parent.application_controller.step_axis(axis_controller_name=self.axis_1_controller_name, dx=-dx)
-        elif tkinter_event.keysym == 'Right':
-            logger.info(f'Moving Axis 1 right by {dx}')
-            self.parent.application_controller.step_axis(axis_controller_name=self.axis_1_controller_name, dx=dx)
-        else:
-            logger.warning('Axis 1 step key not identified')
-        # Update the reader
-        self.gui.axis_1_readout_entry.config(state='normal')     
-        self.gui.axis_1_readout_entry.delete(0,'end')
-        self.gui.axis_1_readout_entry.insert(
-            0,round(self.parent.application_controller.positioners[self.axis_1_controller_name].last_write_value,
-                    self.read_precision))
-        self.gui.axis_1_readout_entry.config(state='readonly')
-    
-    def step_axis_2(self, tkinter_event=None):
+        dx = sign*float(self._axes[axis_idx][2].get())
+        self._pending_dx[axis_idx] = self._pending_dx.get(axis_idx, 0.0) + dx
+        if self._step_job is None:
+            self._step_job = self.parent.root.after(self.STEP_INTERVAL, self._flush_steps)
+
+    def _flush_steps(self):
         '''
-        Steps the axis 2 position by the value specified in the GUI
-        with direction dependent on the key press
+        Sends the net pending step of each axis to the hardware
         '''
-        #if self.stepping_active:
-        # Get the position from the GUI element
-        dx = float(self.gui.axis_2_step_entry.get())
-        # Set the axis
-        if tkinter_event.keysym == 'Down':
-            logger.info(f'Moving Axis 2 down by {dx}')
-            self.parent.application_controller.step_axis(axis_controller_name=self.axis_2_controller_name, dx=-dx)
-        elif tkinter_event.keysym == 'Up':
-            logger.info(f'Moving Axis 2 up by {dx}')
-            self.parent.application_controller.step_axis(axis_controller_name=self.axis_2_controller_name, dx=dx)
-        else:
-            logger.warning('Axis 2 step key not identified')
-        # Update the reader
-        self.gui.axis_2_readout_entry.config(state='normal')     
-        self.gui.axis_2_readout_entry.delete(0,'end')
-        self.gui.axis_2_readout_entry.insert(
-            0,round(self.parent.application_controller.positioners[self.axis_2_controller_name].last_write_value,
-                    self.read_precision))
-        self.gui.axis_2_readout_entry.config(state='readonly')
-
-    
-
-class ThreeAxisApplicationControl():
+        pending_dx, self._pending_dx, self._step_job = self._pending_dx, {}, None
+        for axis_idx, dx in pending_dx.items():
+            if dx != 0:
+                logger.info('Moving Axis %d by %s', axis_idx+1, dx)
+                self._apply(axis_idx, dx=dx)
+
+
+class TwoAxisApplicationControl(AxisApplicationControl):
     '''
-    Application controller for three axis movement
+    Application controller for two axis movement
     '''
 
+    # Step axis 1 with left/right and axis 2 with up/down
+    KEY_BINDINGS = {
+        '<Left>': (0, -1),
+        '<Right>': (0, 1),
+        '<Down>': (1, -1),
+        '<Up>': (1, 1),
+    }
+
     def __init__(self,
                  parent: PositionControllerApplication,
-                 gui: ThreeAxisApplicationView,
+                 gui: NAxisApplicationView,
                  axis_1_controller_name: str,
                  axis_2_controller_name: str, 
-                 axis_3_controller_name: str, 
                  read_precision: int=1):
         
         # Save the controller names for each axis
-        self.parent = parent
-        self.gui = gui
         self.axis_1_controller_name = axis_1_controller_name
         self.axis_2_controller_name = axis_2_controller_name
-        self.axis_3_controller_name = axis_3_controller_name
-        self.read_precision = read_precision
+        super().__init__(parent=parent,
+                         gui=gui,
+                         axis_controller_names=[axis_1_controller_name, axis_2_controller_name],
+                         read_precision=read_precision)
 
-        # Bind buttons
-        self.gui.stepping_laser_toggle.config(command=self.toggle_stepping)
-        self.gui.axis_1_set_button.bind("<Button>", self.set_axis_1)
-        self.gui.axis_2_set_button.bind("<Button>", self.set_axis_2)
-        self.gui.axis_3_set_button.bind("<Button>", self.set_axis_3)
-
-        # Initialize the GUI entries depending on the type of controller
-        # See the TwoAxisApplicationController code for comments.
-        if isinstance(self.parent.positioners[self.axis_1_controller_name], NidaqPositionController):
-            self.set_axis_1()
-        if isinstance(self.parent.positioners[self.axis_1_controller_name], NewportMicrometer):
-            current_position = round(self.parent.positioners[self.axis_1_controller_name].read_position(),self.read_precision)
-            self.gui.axis_1_set_entry.insert(0, current_position)
-            self.set_axis_1()
-        if isinstance(self.parent.positioners[self.axis_2_controller_name], NidaqPositionController):
-            self.set_axis_2()
-        if isinstance(self.parent.positioners[self.axis_2_controller_name], NewportMicrometer):
-            current_position = round(self.parent.positioners[self.axis_2_controller_name].read_position(),self.read_precision)
-            self.gui.axis_2_set_entry.insert(0, current_position)
-            self.set_axis_2()
-        if isinstance(self.parent.positioners[self.axis_3_controller_name], NidaqPositionController):
-            self.set_axis_3()
-        if isinstance(self.parent.positioners[self.axis_3_controller_name], NewportMicrometer):
-            current_position = round(self.parent.positioners[self.axis_3_controller_name].read_position(),self.read_precision)
-            self.gui.axis_3_set_entry.insert(0, current_position)
-            self.set_axis_3()
-        # ===============================================================================
-        # Add more startup logic for new controllers here if needed
-        # ===============================================================================
 
-    def toggle_stepping(self):
-        '''
-        Callback for when the toggle checkbox is clicked.
-        Sets enables or disables stepping depending on the state.
-        '''
-        if (self.gui.stepping_active.get() == 1):
-            # Disable the other stepping checkboxes if they are active
-            for controller in self.parent.movement_controllers:
-                if controller is not self and (controller.gui.stepping_active.get() == 1):
-                    # Uncheck the box
-                    controller.gui.stepping_active.set(0)
-                    # Toggle the stepping
-                    controller.toggle_stepping()
-            # Bind the keys to root
-            self.parent.root.bind('<Left>', self.step_axis_1)
-            self.parent.root.bind('<Right>', self.step_axis_1)
-            self.parent.root.bind('<Up>', self.step_axis_2)
-            self.parent.root.bind('<Down>', self.step_axis_2)
-            # For the third axis, allow for '=' or '+' to zoom since numpad has '+'
-            self.parent.root.bind('<=>', self.step_axis_3)
-            self.parent.root.bind('<+>', self.step_axis_3)
-            self.parent.root.bind('<minus>', self.step_axis_3)
-            logger.info('Stepping active.')
-        else:
-            # Unbind all events tied to the root window except for the return key refocus
-            for event in self.parent.root.bind():
-                if event != '<Key-Return>':
-                    self.parent.root.unbind(event)
-            logger.info('Stepping inactive.')
+class ThreeAxisApplicationControl(AxisApplicationControl):
+    '''
+    Application controller for three axis movement
+    '''
 
+    # Step axis 1 with left/right and axis 2 with up/down. For the third axis, allow
+    # for '=' or '+' to zoom since numpad has '+'
+    KEY_BINDINGS = {
+        '<Left>': (0, -1),
+        '<Right>': (0, 1),
+        '<Down>': (1, -1),
+        '<Up>': (1, 1),
+        '<minus>': (2, -1),
+        '<=>': (2, 1),
+        '<+>': (2, 1),
+    }
 
-    # Call back functions for setting x,y positions and 
-    def set_axis_1(self, tkinter_event=None):
-        '''
-        Moves the axis 1 position to the value specified in the GUI
-        '''
-        # Get the position from the GUI element
-        position = float(self.gui.axis_1_set_entry.get())
-        # Set the axis
-        self.parent.application_controller.move_axis(
-            axis_controller_name=self.axis_1_controller_name, 
-            position=position)
-        # Update the reader
-        self.gui.axis_1_readout_entry.config(state='normal')     
-        self.gui.axis_1_readout_entry.delete(0,'end')
-        self.gui.axis_1_readout_entry.insert(
-            0,round(self.parent.application_controller.positioners[self.axis_1_controller_name].last_write_value,
-                    self.read_precision))
-        self.gui.axis_1_readout_entry.config(state='readonly')
-
-    
-    def set_axis_2(self, tkinter_event=None):
-        '''
-        Moves the axis 2 position to the value specified in the GUI
-        '''
-        # Get the position from the GUI element
-        position = float(self.gui.axis_2_set_entry.get())
-        # Set the axis
-        self.parent.application_controller.move_axis(
-            axis_controller_name=self.axis_2_controller_name, position=position)
-        # Update the reader
-        self.gui.axis_2_readout_entry.config(state='normal')     
-        self.gui.axis_2_readout_entry.delete(0,'end')
-        self.gui.axis_2_readout_entry.insert(
-            0,round(self.parent.application_controller.positioners[self.axis_2_controller_name].last_write_value,
-                    self.read_precision))
-        self.gui.axis_2_readout_entry.config(state='readonly')
-
-    def set_axis_3(self, tkinter_event=None):
-        '''
-        Moves the axis 3 position to the value specified in the GUI
-        '''
-        # Get the position from the GUI element
-        position = float(self.gui.axis_3_set_entry.get())
-        # Set the axis
-        self.parent.application_controller.move_axis(
-            axis_controller_name=self.axis_3_controller_name, position=position)
-        # Update the reader
-        self.gui.axis_3_readout_entry.config(state='normal')     
-        self.gui.axis_3_readout_entry.delete(0,'end')
-        self.gui.axis_3_readout_entry.insert(
-            0,round(self.parent.application_controller.positioners[self.axis_3_controller_name].last_write_value,
-                    self.read_precision))
-        self.gui.axis_3_readout_entry.config(state='readonly')
-
-    def step_axis_1(self, tkinter_event=None):
-        '''
-        Steps the axis 1 position by the value specified in the GUI
-        with direction dependent on the key press
-        '''
-        #if self.stepping_active:
-        # Get the position from the GUI element
-        dx = float(self.gui.axis_1_step_entry.get())
-        # Set the axis
-        if tkinter_event.keysym == 'Left':
-            logger.info(f'Moving Axis 1 left by {dx}')
-            self.parent.application_controller.step_axis(axis_controller_name=self.axis_1_controller_name, dx=-dx)
-        elif tkinter_event.keysym == 'Right':
-            logger.info(f'Moving Axis 1 right by {dx}')
-            self.parent.application_controller.step_axis(axis_controller_name=self.axis_1_controller_name, dx=dx)
-        else:
-            logger.warning('Axis 1 step key not identified')
-        # Update the reader
-        self.gui.axis_1_readout_entry.config(state='normal')     
-        self.gui.axis_1_readout_entry.delete(0,'end')
-        self.gui.axis_1_readout_entry.insert(
-            0,round(self.parent.application_controller.positioners[self.axis_1_controller_name].last_write_value,
-                    self.read_precision))
-        self.gui.axis_1_readout_entry.config(state='readonly')
-    
-    def step_axis_2(self, tkinter_event=None):
-        '''
-        Steps the axis 2 position by the value specified in the GUI
-        with direction dependent on the key press
-        '''
-        #if self.stepping_active:
-        # Get the position from the GUI element
-        dx = float(self.gui.axis_2_step_entry.get())
-        # Set the axis
-        if tkinter_event.keysym == 'Down':
-            logger.info(f'Moving Axis 2 down by {dx}')
-            self.parent.application_controller.step_axis(axis_controller_name=self.axis_2_controller_name, dx=-dx)
-        elif tkinter_event.keysym == 'Up':
-            logger.info(f'Moving Axis 2 up by {dx}')
-            self.parent.application_controller.step_axis(axis_controller_name=self.axis_2_controller_name, dx=dx)
-        else:
-            logger.warning('Axis 2 step key not identified')
-        # Update the reader
-        self.gui.axis_2_readout_entry.config(state='normal')     
-        self.gui.axis_2_readout_entry.delete(0,'end')
-        self.gui.axis_2_readout_entry.insert(
-            0,round(self.parent.application_controller.positioners[self.axis_2_controller_name].last_write_value,
-                    self.read_precision))
-        self.gui.axis_2_readout_entry.config(state='readonly')
-
-    def step_axis_3(self, tkinter_event=None):
-        '''
-        Steps the axis 3 position by the value specified in the GUI
-        with direction dependent on the key press
-        '''
-        #if self.stepping_active:
-        # Get the position from the GUI element
-        dx = float(self.gui.axis_3_step_entry.get())
-        # Set the axis
-        if tkinter_event.keysym == 'minus':
-            logger.info(f'Moving Axis 3 down by {dx}')
-            self.parent.application_controller.step_axis(axis_controller_name=self.axis_3_controller_name, dx=-dx)
-        elif tkinter_event.char == '=' or tkinter_event.char == '+':
-            logger.info(f'Moving Axis 3 up by {dx}')
-            self.parent.application_controller.step_axis(axis_controller_name=self.axis_3_controller_name, dx=dx)
-        else:
-            logger.warning('Axis 3 step key not identified')
-        # Update the reader
-        self.gui.axis_3_readout_entry.config(state='normal')     
-        self.gui.axis_3_readout_entry.delete(0,'end')
-        self.gui.axis_3_readout_entry.insert(
-            0,round(self.parent.application_controller.positioners[self.axis_3_controller_name].last_write_value,
-                    self.read_precision))
-        self.gui.axis_3_readout_entry.config(state='readonly')
+    def __init__(self,
+                 parent: PositionControllerApplication,
+                 gui: NAxisApplicationView,
+                 axis_1_controller_name: str,
+                 axis_2_controller_name: str, 
+                 axis_3_controller_name: str, 
+                 read_precision: int=1):
+        
+        # Save the controller names for each axis
+        self.axis_1_controller_name = axis_1_controller_name
+        self.axis_2_controller_name = axis_2_controller_name
+        self.axis_3_controller_name = axis_3_controller_name
+        super().__init__(parent=parent,
+                         gui=gui,
+                         axis_controller_names=[axis_1_controller_name, 
+                                                axis_2_controller_name, 
+                                                axis_3_controller_name],
+                         read_precision=read_precision)
 
 
-def main(is_root_process=True):
+def main(is_root_process=True) -> PositionControllerApplication:
+    logging.basicConfig(level=logging.INFO)
     tkapp = PositionControllerApplication(
         default_config_filename=DEFAULT_CONFIG_FILE,
         is_root_process=is_root_process)
     tkapp.run()
+    return tkapp
 
 
 if __name__ == '__main__':
@@ -22,6 +22,15 @@ class PleScanner:
         simultaneous processing will require additional development at this time.
     '''
 
+    # Names of the scan parameters returned by `snapshot()`
+    SCAN_PARAMETERS = (
+        'min', 'max', 'n_pixels_up', 'n_pixels_down', 'n_subpixels', 'time_up', 'time_down',
+        'n_scans', 'time_repump', 'pixel_step_size_up', 'pixel_step_size_down', 
+        'sample_step_size_up', 'sample_step_size_down', 'pixel_voltages_up', 
+        'pixel_voltages_down', 'sample_voltages_up', 'sample_voltages_down', 'pixel_time_up',
+        'pixel_time_down', 'sample_time_up', 'sample_time_down',
+    )
+
     def __init__(self, 
                  readers: dict, 
                  wavelength_controller: NidaqVoltageController,
@@ -43,6 +52,10 @@ class PleScanner:
         '''
         # Store the readers and wavelength controller
         self.readers = readers
+        # The readers which are NidaqTimedRateCounters (the only type currently read out
+        # during the scan), resolved once here instead of at every sample
+        self.counter_readers = {name: reader for name, reader in readers.items()
+                                if isinstance(reader, NidaqTimedRateCounter)}
         self.wavelength_controller = wavelength_controller
         self.auxiliary_controllers = auxiliary_controllers
         
@@ -50,6 +63,7 @@ class PleScanner:
         self.running = False
         self.stop_scan = False
         self.current_frame = 0
+        self.data_revision = 0              # Incremented each time new data is added to outputs
 
         # Scan parameters
         # Base parameters
@@ -78,6 +92,11 @@ class PleScanner:
         
         # Ouptuts
         self.outputs = []
+        # Preallocated 2-d arrays of the counts per second of each scan (rows) for each 
+        # NidaqTimedRateCounter reader, keyed by the reader name. Allocated by 
+        # self.configure_scan() and filled as the scans complete; only the first 
+        # self.current_frame rows are valid, the remaining rows are np.nan.
+        self.scan_images = {}
         # If you want additional data to be stored you can include new variables
         # here and then ensure that the self.single_scan() method writes the results
         # to the attributes.
@@ -279,6 +298,12 @@ class PleScanner:
         self.sample_voltages_up = np.linspace(min, max - self.sample_step_size_up, n_pixels_up * n_subpixels)
         self.sample_voltages_down = np.linspace(max, min - self.sample_step_size_down, n_pixels_down * n_subpixels)
 
+        # Allocate the image buffers for the maximum number of scans
+        # Single precision is ample for the count rates and halves the saved file size
+        # The scans not yet completed are np.nan so that they are blank when displayed
+        self.scan_images = {reader: np.full((n_scans, n_pixels_up + n_pixels_down), np.nan, dtype=np.float32)
+                            for reader in self.counter_readers}
+
         # Calculate time per pixel
         self.pixel_time_up = time_up / n_pixels_up
         self.pixel_time_down = time_down / n_pixels_down
@@ -303,14 +328,36 @@ class PleScanner:
         
 
 
+    def snapshot(self) -> dict:
+        '''
+        Returns a dictionary of the current scan parameters (as set by 
+        `self.configure_scan()`) keyed by the names in `SCAN_PARAMETERS`.
+        
+        The voltage arrays are returned by reference. This is safe since they are
+        never modified in place, only replaced when the scan is reconfigured.
+        '''
+        return {name: getattr(self, name) for name in self.SCAN_PARAMETERS}
+
+    def get_image(self, reader: str) -> np.ndarray:
+        '''
+        Returns the 2-d array of counts per second of the completed scans (rows) for the
+        NidaqTimedRateCounter `reader`. This is a view of the image buffer, not a copy.
+        '''
+        return self.scan_images[reader][:self.current_frame]
+
     def scan_wavelengths(self) -> None:
         """
         Scans the wavelengths from v_start to v_end in steps of step_size.
         Records the output from the readers into a list of dictionaries
         """
 
-        self.outputs.append(self.single_scan())
+        output = self.single_scan()
+        self.outputs.append(output)
+        # Write the processed counts into the image buffers
+        for reader, image in self.scan_images.items():
+            image[self.current_frame] = output[reader]
         self.current_frame = self.current_frame + 1
+        self.data_revision = self.data_revision + 1
 
     
     def single_scan(self) -> list:
@@ -366,9 +413,8 @@ class PleScanner:
         logger.info(f'Starting upsweep on scan {self.current_frame+1}.')
 
         # Configure the DAQ counter for the upsweep
-        for reader in self.readers:
-            if isinstance(self.readers[reader], NidaqTimedRateCounter):
-                self.readers[reader].configure_sample_time(sample_time=self.sample_time_up)
+        for counter in self.counter_readers.values():
+            counter.configure_sample_time(sample_time=self.sample_time_up)
 
         # Scan the upsweep over all sample voltages
         for voltage in self.sample_voltages_up:
@@ -380,43 +426,37 @@ class PleScanner:
             # We want to eventually handle multiple readers simultaneously
             # However in the current setup this is not straightforward
             # For now we will have a simplifed fix that only performs readout when
-            # the reader is of the specified QT3ScanNIDAQEdgeCounterController class
+            # the reader is of the NidaqTimedRateCounter class (`self.counter_readers`)
             # In all other cases nothing happens.
-            # However since we need to check each reader this will cause extraneous 
-            # if statements causing some lag.
-            for reader in self.readers:
-
-                # Check if reader is the desired class.
-                # Everything in here probably needs to be in a separate thread target
-                # function and additional threads need to be launched for other readers
-                if isinstance(self.readers[reader], NidaqTimedRateCounter):
-
-                    # This samples one batch consisting of N clock cycles on the DAQ
-                    # where N = self.sample_time_up * clock_frequency (which is set
-                    # by the YAML configuration file). Note that this results in a
-                    # truncation of the actual sample time to the resolution of the
-                    # clock rate, but we can more or less ignore these errors since
-                    # they are generally very small (< 1 microsecond).
-                    # The output counts_at_sample is an array [[counts, N]] where,
-                    # again, N is the number of clock cycles per batch.
-
-                    # New update: get a single batch raw output
-                    # Code currently expects the 2d output so reshape it for now
-                    raw_counts_at_sample = self.readers[reader].sample_batch_raw().reshape(1,2) 
-
-                    # Write raw counts to outputs dictionary
-                    # The dictionary value at the desired reader will take the form
-                    # [[[counts at voltage[i], clock_cycles at voltage[i]]], for i in samples]
-                    raw_output_at_samples_up[reader].append(raw_counts_at_sample)
+            # Everything in here probably needs to be in a separate thread target
+            # function and additional threads need to be launched for other readers
+            for reader, counter in self.counter_readers.items():
+
+                # This samples one batch consisting of N clock cycles on the DAQ
+                # where N = self.sample_time_up * clock_frequency (which is set
+                # by the YAML configuration file). Note that this results in a
+                # truncation of the actual sample time to the resolution of the
+                # clock rate, but we can more or less ignore these errors since
+                # they are generally very small (< 1 microsecond).
+                # The output counts_at_sample is an array [[counts, N]] where,
+                # again, N is the number of clock cycles per batch.
+
+                # New update: get a single batch raw output
+                # Code currently expects the 2d output so reshape it for now
+                raw_counts_at_sample = counter.sample_batch_raw().reshape(1,2) 
+
+                # Write raw counts to outputs dictionary
+                # The dictionary value at the desired reader will take the form
+                # [[[counts at voltage[i], clock_cycles at voltage[i]]], for i in samples]
+                raw_output_at_samples_up[reader].append(raw_counts_at_sample)
 
         # Log start of downsweep
         logger.info(f'Finished upsweep on scan {self.current_frame+1}')
         logger.info(f'Starting downsweep on scan {self.current_frame+1}')
 
         # Configure the DAQ counter for the downsweep
-        for reader in self.readers:
-            if isinstance(self.readers[reader], NidaqTimedRateCounter):
-                self.readers[reader].configure_sample_time(sample_time=self.sample_time_down)
+        for counter in self.counter_readers.values():
+            counter.configure_sample_time(sample_time=self.sample_time_down)
 
         # Now scan the voltages down
         for voltage in self.sample_voltages_down:
@@ -424,13 +464,12 @@ class PleScanner:
             self.wavelength_controller.go_to_voltage(voltage=voltage)
             logger.debug(f'Move to voltage: {voltage}')
             # Same as before; must be modified accordingly to handle multiple readers.
-            for reader in self.readers:
-                if isinstance(self.readers[reader], NidaqTimedRateCounter):
-                    # New update: get a single batch raw output
-                    # reshaping for now since output is expected to be weird.
-                    raw_counts_at_sample = self.readers[reader].sample_batch_raw().reshape(1,2) 
-                    # Now saving to downsweep dictionary
-                    raw_output_at_samples_down[reader].append(raw_counts_at_sample)
+            for reader, counter in self.counter_readers.items():
+                # New update: get a single batch raw output
+                # reshaping for now since output is expected to be weird.
+                raw_counts_at_sample = counter.sample_batch_raw().reshape(1,2) 
+                # Now saving to downsweep dictionary
+                raw_output_at_samples_down[reader].append(raw_counts_at_sample)
 
         # Log end of downsweep
         logger.info(f'Finished downsweep on scan {self.current_frame+1}')
@@ -444,7 +483,7 @@ class PleScanner:
         for reader in self.readers:
             # Logic for processing each type of reader will depend on the output structure
             # of the corresponding reader. Thus, each type should be implemented separately
-            if isinstance(self.readers[reader], NidaqTimedRateCounter):
+            if reader in self.counter_readers:
 
                 # Remove the extra dimension(s)
                 raw_output_up = np.array(raw_output_at_samples_up[reader]).squeeze()
@@ -1,20 +1,71 @@
 import logging
+import time
 
-import matplotlib
+import matplotlib.ticker
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 import numpy as np
 import tkinter as tk
 
+from qdlutils.applications.common import named_font
 from qdlutils.hardware.nidaq.counters.nidaqtimedratecounter import NidaqTimedRateCounter
 
-matplotlib.use('Agg')
-
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
+# Scan settings entries in the `ControlPanel` and `DataViewportControlPanel`
+# Each field is given as (label, attribute name of the entry, key of the scan settings)
+SCAN_SETTINGS_FIELDS = [
+    ('Min voltage (V)', 'voltage_start_entry', 'min'),
+    ('Max voltage (V)', 'voltage_end_entry', 'max'),
+    ('# of pixels up', 'num_pixels_up_entry', 'n_pixels_up'),
+    ('# of pixels down', 'num_pixels_down_entry', 'n_pixels_down'),
+    ('# of scans', 'scan_num_entry', 'n_scans'),
+    ('Upsweep time (s)', 'upsweep_time_entry', 'time_up'),
+    ('Downsweep time (s)', 'downsweep_time_entry', 'time_down'),
+]
+# Number of subpixels to sample (each pixel has this number of samples)
+# Note that excessively large values will slow the scan speed down due to
+# the voltage movement overhead.
+ADVANCED_SETTINGS_FIELDS = [
+    ('# of sub-pixels', 'subpixel_entry', 'n_subpixels'),
+    ('Reump time (ms)', 'repump_entry', 'time_repump'),
+]
+# Keys of the scan settings displayed by `_add_scan_settings_entries()`
+SCAN_SETTINGS_KEYS = tuple(key for _, _, key in SCAN_SETTINGS_FIELDS + ADVANCED_SETTINGS_FIELDS)
+
+def _add_entry(panel, frame: tk.Frame, row: int, label: str, attr: str, value, readonly: bool = False) -> tk.Entry:
+    '''
+    Adds a labeled entry with initial `value` to `frame` on the given `row` and stores
+    it as `panel.attr`.
+    '''
+    tk.Label(frame, text=label).grid(row=row, column=0)
+    entry = tk.Entry(frame, width=10)
+    entry.insert(0, value)
+    if readonly:
+        entry.config(state='readonly')
+    entry.grid(row=row, column=1)
+    setattr(panel, attr, entry)
+    return entry
+
+def _add_scan_settings_entries(panel, frame: tk.Frame, row: int, settings: dict, readonly: bool = False) -> int:
+    '''
+    Adds the scan settings entries to `frame` starting at `row`, with values taken from
+    the `settings` dictionary. Returns the last row used.
+    '''
+    for label, attr, key in SCAN_SETTINGS_FIELDS:
+        _add_entry(panel, frame, row, label, attr, settings[key], readonly=readonly)
+        row += 1
+    # Adding advanced settings
+    tk.Label(frame, text="Advanced settings:", font=named_font(frame, 10)).grid(row=row, column=0, pady=[8,0], columnspan=3)
+    for label, attr, key in ADVANCED_SETTINGS_FIELDS:
+        row += 1
+        _add_entry(panel, frame, row, label, attr, settings[key], readonly=readonly)
+    return row
+
+
 class MainApplicationView():
     '''
     Main application GUI view, loads SidePanel and ScanImage
@@ -42,7 +93,7 @@ class ControlPanel():
         command_frame.pack(side=tk.TOP, padx=20, pady=10)
         # Add buttons and text
         row = 0
-        tk.Label(command_frame, text="PLE scan control", font='Helvetica 14').grid(row=row, column=0, pady=[0,10], columnspan=2)
+        tk.Label(command_frame, text="PLE scan control", font=named_font(command_frame, 14)).grid(row=row, column=0, pady=[0,10], columnspan=2)
         row += 1
         self.start_button = tk.Button(command_frame, text="Start Scan", width=12)
         self.start_button.grid(row=row, column=0, columnspan=1, padx=3)
@@ -52,73 +103,23 @@ class ControlPanel():
         # Define settings frame to set all scan settings
         settings_frame = tk.Frame(base_frame)
         settings_frame.pack(side=tk.TOP, padx=20, pady=10)
-        # Min voltage
-        row += 1
-        tk.Label(settings_frame, text="Min voltage (V)").grid(row=row, column=0)
-        self.voltage_start_entry = tk.Entry(settings_frame, width=10)
-        self.voltage_start_entry.insert(10, scan_range[0])
-        self.voltage_start_entry.grid(row=row, column=1)
-        # Max voltage
-        row += 1
-        tk.Label(settings_frame, text="Max voltage (V)").grid(row=row, column=0)
-        self.voltage_end_entry = tk.Entry(settings_frame, width=10)
-        self.voltage_end_entry.insert(10, scan_range[1])
-        self.voltage_end_entry.grid(row=row, column=1)
-        # Number of pixels on upsweep
-        row += 1
-        tk.Label(settings_frame, text="# of pixels up").grid(row=row, column=0)
-        self.num_pixels_up_entry = tk.Entry(settings_frame, width=10)
-        self.num_pixels_up_entry.insert(10, 150)
-        self.num_pixels_up_entry.grid(row=row, column=1)
-        # Number of pixels on downsweep
-        row += 1
-        tk.Label(settings_frame, text="# of pixels down").grid(row=row, column=0)
-        self.num_pixels_down_entry = tk.Entry(settings_frame, width=10)
-        self.num_pixels_down_entry.insert(10, 10)
-        self.num_pixels_down_entry.grid(row=row, column=1)
-        # Number of scans
-        row += 1
-        tk.Label(settings_frame, text="# of scans").grid(row=row, column=0)
-        self.scan_num_entry = tk.Entry(settings_frame, width=10)
-        self.scan_num_entry.insert(10, 10)
-        self.scan_num_entry.grid(row=row, column=1, padx=10)
-        # Time for the upsweep min -> max
-        row += 1
-        tk.Label(settings_frame, text="Upsweep time (s)").grid(row=row, column=0)
-        self.upsweep_time_entry = tk.Entry(settings_frame, width=10)
-        self.upsweep_time_entry.insert(10, 3)
-        self.upsweep_time_entry.grid(row=row, column=1)
-        # Time for the downsweep max -> min
-        row += 1
-        tk.Label(settings_frame, text="Downsweep time (s)").grid(row=row, column=0)
-        self.downsweep_time_entry = tk.Entry(settings_frame, width=10)
-        self.downsweep_time_entry.insert(10, 1)
-        self.downsweep_time_entry.grid(row=row, column=1, padx=10)
-        # Adding advanced settings
-        row += 1
-        tk.Label(settings_frame, text="Advanced settings:", font='Helvetica 10').grid(row=row, column=0, pady=[8,0], columnspan=3)
-        # Number of subpixels to sample (each pixel has this number of samples)
-        # Note that excessively large values will slow the scan speed down due to
-        # the voltage movement overhead.
-        row += 1
-        tk.Label(settings_frame, text="# of sub-pixels").grid(row=row, column=0)
-        self.subpixel_entry = tk.Entry(settings_frame, width=10)
-        self.subpixel_entry.insert(10, 4)
-        self.subpixel_entry.grid(row=row, column=1)
-        # Button to enable repump at start of scan?
-        row += 1
-        tk.Label(settings_frame, text="Reump time (ms)").grid(row=row, column=0)
-        self.repump_entry = tk.Entry(settings_frame, width=10)
-        self.repump_entry.insert(10, 0)
-        self.repump_entry.grid(row=row, column=1)
-
+        default_settings = {'min': scan_range[0], 
+                            'max': scan_range[1], 
+                            'n_pixels_up': 150, 
+                            'n_pixels_down': 10, 
+                            'n_scans': 10, 
+                            'time_up': 3, 
+                            'time_down': 1, 
+                            'n_subpixels': 4, 
+                            'time_repump': 0}
+        row = _add_scan_settings_entries(self, settings_frame, row+1, default_settings)
 
         # Define control frame to modify DAQ settings
         control_frame = tk.Frame(base_frame)
         control_frame.pack(side=tk.TOP, padx=20, pady=10)
         # Label
         row += 1
-        tk.Label(control_frame, text="DAQ control", font='Helvetica 14').grid(row=row, column=0, pady=[0,5], columnspan=2)
+        tk.Label(control_frame, text="DAQ control", font=named_font(control_frame, 14)).grid(row=row, column=0, pady=[0,5], columnspan=2)
         # Setter for the voltage
         row += 1
         self.goto_button = tk.Button(control_frame, text="Set voltage (V)", width=12)
@@ -145,7 +146,7 @@ class ControlPanel():
         # Define config frame to set the config file
         config_frame = tk.Frame(base_frame)
         config_frame.pack(side=tk.TOP, padx=20, pady=10)
-        tk.Label(config_frame, text="Hardware Configuration", font='Helvetica 14').grid(row=row, column=0, pady=[0,5], columnspan=1)
+        tk.Label(config_frame, text="Hardware Configuration", font=named_font(config_frame, 14)).grid(row=row, column=0, pady=[0,5], columnspan=1)
         # Dialouge button to pick the YAML config
         row += 1
         self.hardware_config_from_yaml_button = tk.Button(config_frame, text="Load YAML Config")
@@ -156,8 +157,11 @@ class ControlPanel():
 class ScanPopoutApplicationView():
     '''
     Scan popout application GUI view, loads DataViewport and SidePanel (new)
+
+    The matplotlib navigation toolbar (zoom, pan, save) is created unless `show_toolbar`
+    is False.
     '''
-    def __init__(self, main_frame, scan_settings: dict) -> None:
+    def __init__(self, main_frame, scan_settings: dict, show_toolbar: bool = True) -> None:
         frame = tk.Frame(main_frame)
         frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -166,12 +170,16 @@ class ScanPopoutApplicationView():
 
         self.canvas = FigureCanvasTkAgg(self.data_viewport.fig, master=frame)
         self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        # Connect to the Tk canvas (callbacks of the placeholder canvas of the figure
+        # are not carried over in older versions of matplotlib)
+        self.canvas.mpl_connect('draw_event', self.data_viewport.on_draw)
 
-        toolbar = NavigationToolbar2Tk(self.canvas, frame)
-        toolbar.update()
+        if show_toolbar:
+            toolbar = NavigationToolbar2Tk(self.canvas, frame)
+            toolbar.update()
         self.canvas._tkcanvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
 
 
@@ -181,12 +189,19 @@ class DataViewport:
 
     Currently it is hard coded for the standard image plot in a PLE scan.
 
+    The image spans all `n_scans` requested scans from the start (scans that have
+    not yet been completed are filled with `np.nan`) so that the axes, colorbar and
+    ticks only need to be drawn once. Subsequent updates only redraw the image
+    artist and blit it onto the canvas.
+
     TODO: Handle internal logic for writing image vs. integrated data to the screen
     '''
 
-    def __init__(self, mplcolormap='Blues') -> None:
-        self.fig = plt.figure()
-        self.ax = plt.gca()
+    def __init__(self, mplcolormap='Blues', max_redraw_rate: float = 30) -> None:
+        # The figure is created directly (not through pyplot) so that it is owned by the
+        # canvas of the scan window and released when the window is closed
+        self.fig = Figure()
+        self.ax = self.fig.add_subplot(111)
         self.cbar = None
         self.cmap = mplcolormap
         self.norm_min = None
@@ -196,111 +211,302 @@ class DataViewport:
 
         self.integrate_scans = False
 
+        # Image artist and the parameters it was initialized with
+        self.artist = None
+        self.image_key = None
+        # Line artist of the integrated plot and the parameters it was initialized with
+        self.line = None
+        self.plot_key = None
+        # Name of the DAQ counter reader in the model outputs
+        self._counter_reader_key = None
+        # Tick locations (and labels) keyed by the number of scans (x) and by the
+        # scan range (y), along with the keys currently applied to the axes
+        self._xticks_cache = {}
+        self._yticks_cache = {}
+        self._last_n_scans = -1
+        self._last_y_key = None
+        # Background of the figure captured on each full draw, used for blitting
+        # `self.on_draw` is connected to the canvas by the view once it is created
+        self.bg = None
+
+        # Limit the rate of updates to `max_redraw_rate` (in Hz). Updates requested
+        # faster than this are coalesced into a single update with the latest model.
+        self._min_interval = 1 / max_redraw_rate
+        self._last_draw_ts = 0.0
+        self._pending = False
+        self._model = None
+        # Data revision and display settings of the last update
+        self._last_draw_key = None
+
 
     def update_figure(self, model) -> None:
         '''
         Updates the ScanImage GUI element
+
+        If the last update was less than `1/max_redraw_rate` seconds ago, the update
+        is deferred until the interval has elapsed (using the most recent `model`).
+        The update is skipped if neither the data (`model.data_revision`) nor the
+        display settings have changed since the last update.
         '''
-        for ax in self.fig.axes:
-            self.fig.delaxes(ax)
-        num_readers = len(model.readers)
-        grid = plt.GridSpec(1, num_readers)
+        if self._draw_key(model) == self._last_draw_key:
+            return
+        self._model = model
+        # An update is already scheduled and will use the latest model
+        if self._pending:
+            return
+        wait = self._min_interval - (time.monotonic() - self._last_draw_ts)
+        if wait > 0:
+            self._pending = True
+            self.fig.canvas.get_tk_widget().after(int(wait*1000)+1, self._flush)
+        else:
+            self._update_figure(model)
 
+    def _flush(self) -> None:
+        '''
+        Performs the deferred update with the most recent model
+        '''
+        self._pending = False
+        self._update_figure(self._model)
+
+    def _draw_key(self, model) -> tuple:
+        '''
+        Returns the data revision of the `model` and the display settings, the figure
+        only needs to be updated if these have changed.
+        '''
+        return (id(model), model.data_revision, self.norm_min, self.norm_max, self.integrate_scans)
+
+    def _update_figure(self, model) -> None:
+        '''
+        Updates the figure immediately
+        '''
+        self._last_draw_ts = time.monotonic()
+        self._last_draw_key = self._draw_key(model)
         if self.integrate_scans:
-            self.update_plot(model, grid)
+            self.update_plot(model)
         else:
-            self.update_image(model, grid)
+            self.update_image(model)
 
-    def update_image(self, model, grid) -> None:
+    def update_image(self, model) -> None:
         '''
         Updates image data in the ScanImage GUI element
+
+        The axes are only rebuilt if the image dimensions or scan range have changed
+        since the last call, otherwise only the image data is updated.
+        '''
+        # Nothing to show until the first scan is completed
+        reader = self._counter_reader(model)
+        if (reader is None) or (model.current_frame == 0):
+            return
+        # The image buffer of the full scan (scans not yet completed are np.nan)
+        img_data = model.scan_images[reader]
+
+        image_key = (img_data.shape, model.n_pixels_up, model.n_pixels_down, model.min, model.max)
+        if (self.artist is None) or (image_key != self.image_key):
+            self._init_axes(model, img_data)
+            self.image_key = image_key
+        else:
+            self._update_image_fast(img_data)
+
+    def _counter_reader(self, model):
+        '''
+        Returns the name of the (single) `NidaqTimedRateCounter` reader of the `model`,
+        or None if there is none. The name is looked up on the first call and reused.
         '''
-        # Quick fix to get it to run
-        img_data = np.array([[]])
+        if self._counter_reader_key is None:
+            self._counter_reader_key = next(
+                (reader for reader, reader_model in model.readers.items() 
+                 if isinstance(reader_model, NidaqTimedRateCounter)), None)
+        return self._counter_reader_key
 
-        # Look for the single DAQ reader and get the image data
-        for reader in model.readers:
-            if isinstance(model.readers[reader], NidaqTimedRateCounter):
-                img_data = np.array([output[reader] for output in model.outputs])
+    def _init_axes(self, model, img_data) -> None:
+        '''
+        Sets up the axes, image artist, colorbar, ticks and labels and requests a full
+        draw of the canvas.
 
+        The axes, image artist and colorbar are only created if they do not yet exist
+        (e.g. on the first call or after showing the integrated plot), otherwise they
+        are reused and only the extent and ticks are updated.
+        '''
         # Calculate the axis extent
         # Want to assign y axis values 0 -> 1 on the upscan, then 1 -> y_max on
         # the downscan. Because imshow scales all samples uniformly, we need
         # (y_max - 1) / 1 = n_pixels_down / n_pixels_up
         y_max = 1 + model.n_pixels_down / model.n_pixels_up
+        extent = [0.5, img_data.shape[0]+0.5, 0, y_max]
+
+        # The ticks must be set on newly created axes
+        new_axes = self.artist is None
+        if new_axes:
+            for ax in self.fig.axes:
+                self.fig.delaxes(ax)
+            # The line must be recreated when switching back
+            self.line = None
+
+            # Plot the scan
+            self.ax = self.fig.add_subplot()
+            self.artist = self.ax.imshow(img_data.T,
+                                         cmap=self.cmap, 
+                                         extent=extent,
+                                         interpolation='nearest',
+                                         aspect='auto',
+                                         origin='lower')
+            self.cbar = self.fig.colorbar(self.artist, ax=self.ax)
+
+            # Set the labels
+            self.ax.set_xlabel('Scan number', fontsize=14)
+            self.ax.set_ylabel('Voltage (V)', fontsize=14)
+            self.cbar.ax.set_ylabel('Counts/sec', fontsize=14, rotation=270, labelpad=15)
+            # Set the grid
+            self.ax.grid(alpha=0.3, axis='y', linewidth=1, color='k')#, dashes=(5,5))
+        else:
+            # Reuse the existing image artist
+            self.artist.set_data(img_data.T)
+            self.artist.set_extent(extent)
+            self.ax.set_xlim(extent[0], extent[1])
+            self.ax.set_ylim(extent[2], extent[3])
 
-        # Plot the scan
-        ax = self.fig.add_subplot()
-        img = ax.imshow(img_data.T,
-                        cmap=self.cmap, 
-                        extent=[0.5,
-                                img_data.shape[0]+0.5,
-                                0,
-                                y_max],
-                        interpolation='none',
-                        aspect='auto',
-                        origin='lower')
-        cbar = self.fig.colorbar(img, ax=ax)
-
-        # Set the xtick labels
+        # Set the xtick labels if the number of scans has changed
         # We set up some logic to make it readable
         n_scans = img_data.shape[0]
-        if n_scans < 11:
-            # Set the xticks on integer values for 1-10
-            ax.set_xticks( np.arange(1,n_scans+1,1) )
-        else:
-            # Set on every 5 if more than 10 scans long
-            ax.set_xticks( np.arange(5,n_scans+1,5) )
-        # Set the ytick labels
-        y_ticks = ax.get_yticks()
-        ax.set_yticks( y_ticks, self.calculate_ytick_labels(y_ticks, model.min, model.max, y_max) ) # Set the yticks to match scan
-        # Reset the extent
-        ax.set_ylim(0,y_max)
-        # Set the labels
-        ax.set_xlabel('Scan number', fontsize=14)
-        ax.set_ylabel('Voltage (V)', fontsize=14)
-        cbar.ax.set_ylabel('Counts/sec', fontsize=14, rotation=270, labelpad=15)
-        # Set the grid
-        ax.grid(alpha=0.3, axis='y', linewidth=1, color='k')#, dashes=(5,5))
-
-        # Normalize the figure if not already normalized
+        if new_axes or (n_scans != self._last_n_scans):
+            if n_scans not in self._xticks_cache:
+                if n_scans < 11:
+                    # Set the xticks on integer values for 1-10
+                    self._xticks_cache[n_scans] = np.arange(1,n_scans+1,1)
+                else:
+                    # Set on every 5 if more than 10 scans long
+                    self._xticks_cache[n_scans] = np.arange(5,n_scans+1,5)
+            self.ax.set_xticks( self._xticks_cache[n_scans] )
+            self._last_n_scans = n_scans
+        # Set the ytick labels if the scan range has changed
+        y_key = (y_max, model.min, model.max)
+        if new_axes or (y_key != self._last_y_key):
+            if y_key not in self._yticks_cache:
+                # Restore the automatic y ticks so that they match the new extent
+                self.ax.yaxis.set_major_locator(matplotlib.ticker.AutoLocator())
+                y_ticks = self.ax.get_yticks()
+                self._yticks_cache[y_key] = (y_ticks, self.calculate_ytick_labels(y_ticks, model.min, model.max, y_max))
+            self.ax.set_yticks( *self._yticks_cache[y_key] ) # Set the yticks to match scan
+            # Reset the extent
+            self.ax.set_ylim(0,y_max)
+            self._last_y_key = y_key
+
+        # Normalize the figure and update the existing colorbar
+        self.artist.set_clim(*self._image_limits(img_data))
+        self.cbar.update_normal(self.artist)
+
+        # Request a full draw of the figure, the background is captured in
+        # `self.on_draw` once it has been drawn
+        self.bg = None
+        self.request_redraw()
+
+    def _update_image_fast(self, img_data) -> None:
+        '''
+        Updates the data of the image artist and blits it onto the canvas.
+
+        If the color limits have changed then the colorbar must also be redrawn, in
+        which case a full draw of the canvas is requested instead. The same is true
+        if no background has been captured since the axes were last initialized.
+        '''
+        self.artist.set_data(img_data.T)
+
+        limits = self._image_limits(img_data)
+        if (limits != self.artist.get_clim()) or (self.bg is None):
+            self.artist.set_clim(*limits)
+            self.cbar.update_normal(self.artist)
+            self.request_redraw()
+            return
+
+        canvas = self.fig.canvas
+        canvas.restore_region(self.bg)
+        self.ax.draw_artist(self.artist)
+        canvas.blit(self.ax.bbox)
+
+    def _image_limits(self, img_data) -> tuple:
+        '''
+        Returns the (min, max) color limits of the image, either from the user-set
+        normalization or the range of the data.
+        '''
         if (self.norm_min is not None) and (self.norm_max is not None):
-            img.set_norm(plt.Normalize(vmin=self.norm_min, vmax=self.norm_max))
+            return (self.norm_min, self.norm_max)
+        return (np.nanmin(img_data), np.nanmax(img_data))
 
-    def calculate_ytick_labels(self, y, y_min, y_max, max_tick):
+    def request_redraw(self) -> None:
         '''
-        Method to compute the ytick labels
+        Requests a full draw of the figure. The draw is performed once Tk returns to
+        the event loop so that multiple requests in quick succession result in only a
+        single draw.
         '''
-        return np.round(np.where(y > 1, (y_min-y_max)*(y-max_tick)/(max_tick-1)+y_min, (y_max-y_min)*y+y_min), decimals=3)
+        self.fig.canvas.draw_idle()
 
-    def update_plot(self, model, grid) -> None:
+    def on_draw(self, event) -> None:
         '''
-        Updates 2-d line plots, currently not in use.
+        Captures the background of the figure after each full draw of the canvas
+        (including those triggered by resizing the window) for blitting.
         '''
+        if self.artist is not None:
+            self.bg = self.fig.canvas.copy_from_bbox(self.fig.bbox)
 
-        # Look for the single DAQ reader and get the image data
-        for reader in model.readers:
-            if isinstance(model.readers[reader], NidaqTimedRateCounter):
-                img_data = np.array([output[reader] for output in model.outputs])
+    def calculate_ytick_labels(self, y, y_min, y_max, max_tick):
+        '''
+        Method to compute the ytick labels
+        '''
+        # The labels are linear in y on the upscan (y <= 1) and the downscan (y > 1)
+        # so we precompute the slope and intercept of each and evaluate in one pass
+        slope_down = (y_min-y_max)/(max_tick-1)
+        slope = np.where(y > 1, slope_down, y_max-y_min)
+        intercept = np.where(y > 1, y_min-slope_down*max_tick, y_min)
+        return np.round(slope*y + intercept, decimals=3)
+
+    def update_plot(self, model) -> None:
+        '''
+        Updates the 2-d line plot of the scans averaged together.
+
+        The axes and line are only rebuilt if the scan size or range have changed since
+        the last call, otherwise only the line data, limits and title are updated.
+        '''
+        # Nothing to show until the first scan is completed
+        reader = self._counter_reader(model)
+        if (reader is None) or (model.current_frame == 0):
+            return
+        img_data = model.get_image(reader)
 
         # Calculate the axis extent
         # Want to assign y axis values 0 -> 1 on the upscan, then 1 -> y_max on
         # the downscan. Because imshow scales all samples uniformly, we need
         # (y_max - 1) / 1 = n_pixels_down / n_pixels_up
         y_max = 1 + model.n_pixels_down / model.n_pixels_up
-        unitless_voltages = np.linspace(0, y_max, model.n_pixels_down + model.n_pixels_up)
+        integrated_data = np.sum(img_data.T, axis=-1)/len(img_data)
+
+        plot_key = (img_data.shape[1], model.n_pixels_up, model.n_pixels_down, model.min, model.max)
+        if (self.line is None) or (plot_key != self.plot_key):
+            for ax in self.fig.axes:
+                self.fig.delaxes(ax)
+            # The image must be recreated when switching back
+            self.artist = None
+            unitless_voltages = np.linspace(0, y_max, model.n_pixels_down + model.n_pixels_up)
+
+            # Plot the scan
+            self.ax = self.fig.add_subplot()
+            self.line, = self.ax.plot(unitless_voltages, integrated_data)
+            self.ax.set_xlabel('Voltage (V)', fontsize=14)
+            self.ax.set_ylabel('Intensity (cts/s)', fontsize=14)
+            x_ticks = self.ax.get_xticks()
+            self.ax.set_xticks( x_ticks, self.calculate_ytick_labels(x_ticks, model.min, model.max, y_max) )
+            self.ax.set_xlim(0,y_max)
+            self.ax.grid(alpha=0.3)
+            self.plot_key = plot_key
+        else:
+            # Reuse the existing line and rescale to the new data
+            self.line.set_ydata(integrated_data)
+            self.ax.relim()
+            self.ax.set_autoscaley_on(True)
+            self.ax.autoscale_view(scalex=False)
+        self.ax.set_ylim(self.norm_min, self.norm_max)
+        self.ax.set_title(f'Integrating {len(img_data)} scans')
 
-        # Plot the scan
-        ax = self.fig.add_subplot()
-        ax.plot(unitless_voltages, np.sum(img_data.T, axis=-1)/len(img_data))
-        ax.set_ylim(self.norm_min, self.norm_max)
-        ax.set_xlabel('Voltage (V)', fontsize=14)
-        ax.set_ylabel('Intensity (cts/s)', fontsize=14)
-        x_ticks = ax.get_xticks()
-        ax.set_xticks( x_ticks, self.calculate_ytick_labels(x_ticks, model.min, model.max, y_max) )
-        ax.set_xlim(0,y_max)
-        ax.grid(alpha=0.3)
-        ax.set_title(f'Integrating {len(img_data)} scans')
+        # The title and limits change with each scan so the full figure is redrawn
+        self.request_redraw()
 
 
     def reset(self) -> None:
@@ -325,7 +531,7 @@ class DataViewportControlPanel():
         command_frame = tk.Frame(base_frame)
         command_frame.pack(side=tk.TOP, padx=20, pady=10)
         row = 0
-        tk.Label(command_frame, text="PLE scan control", font='Helvetica 14').grid(row=row, column=0, pady=[0,10], columnspan=2)
+        tk.Label(command_frame, text="PLE scan control", font=named_font(command_frame, 14)).grid(row=row, column=0, pady=[0,10], columnspan=2)
         row += 1
         self.save_scan_button = tk.Button(command_frame, text="Save Scan", width=12)
         self.save_scan_button.grid(row=row, column=0, columnspan=2, padx=0)
@@ -335,75 +541,8 @@ class DataViewportControlPanel():
         settings_frame = tk.Frame(base_frame)
         settings_frame.pack(side=tk.TOP, padx=20, pady=10)
         row=0
-        tk.Label(settings_frame, text="Scan settings", font='Helvetica 14').grid(row=row, column=0, pady=[0,10], columnspan=2)
-        # Min voltage
-        row += 1
-        tk.Label(settings_frame, text="Min voltage (V)").grid(row=row, column=0)
-        self.voltage_start_entry = tk.Entry(settings_frame, width=10)
-        self.voltage_start_entry.insert(0, scan_settings['min'])
-        self.voltage_start_entry.config(state='readonly')
-        self.voltage_start_entry.grid(row=row, column=1)
-        # Max voltage
-        row += 1
-        tk.Label(settings_frame, text="Max voltage (V)").grid(row=row, column=0)
-        self.voltage_end_entry = tk.Entry(settings_frame, width=10)
-        self.voltage_end_entry.insert(0, scan_settings['max'])
-        self.voltage_end_entry.config(state='readonly')
-        self.voltage_end_entry.grid(row=row, column=1)
-        # Number of pixels on upsweep
-        row += 1
-        tk.Label(settings_frame, text="# of pixels up").grid(row=row, column=0)
-        self.num_pixels_up_entry = tk.Entry(settings_frame, width=10)
-        self.num_pixels_up_entry.insert(0, scan_settings['n_pixels_up'])
-        self.num_pixels_up_entry.config(state='readonly')
-        self.num_pixels_up_entry.grid(row=row, column=1)
-        # Number of pixels on downsweep
-        row += 1
-        tk.Label(settings_frame, text="# of pixels down").grid(row=row, column=0)
-        self.num_pixels_down_entry = tk.Entry(settings_frame, width=10)
-        self.num_pixels_down_entry.insert(0, scan_settings['n_pixels_down'])
-        self.num_pixels_down_entry.config(state='readonly')
-        self.num_pixels_down_entry.grid(row=row, column=1)
-        # Number of scans
-        row += 1
-        tk.Label(settings_frame, text="# of scans").grid(row=row, column=0)
-        self.scan_num_entry = tk.Entry(settings_frame, width=10)
-        self.scan_num_entry.insert(0, scan_settings['n_scans'])
-        self.scan_num_entry.config(state='readonly')
-        self.scan_num_entry.grid(row=row, column=1, padx=10)
-        # Time for the upsweep min -> max
-        row += 1
-        tk.Label(settings_frame, text="Upsweep time (s)").grid(row=row, column=0)
-        self.upsweep_time_entry = tk.Entry(settings_frame, width=10)
-        self.upsweep_time_entry.insert(0, scan_settings['time_up'])
-        self.upsweep_time_entry.config(state='readonly')
-        self.upsweep_time_entry.grid(row=row, column=1)
-        # Time for the downsweep max -> min
-        row += 1
-        tk.Label(settings_frame, text="Downsweep time (s)").grid(row=row, column=0)
-        self.downsweep_time_entry = tk.Entry(settings_frame, width=10)
-        self.downsweep_time_entry.insert(0, scan_settings['time_down'])
-        self.downsweep_time_entry.config(state='readonly')
-        self.downsweep_time_entry.grid(row=row, column=1, padx=10)
-        # Adding advanced settings
-        row += 1
-        tk.Label(settings_frame, text="Advanced settings:", font='Helvetica 10').grid(row=row, column=0, pady=[8,0], columnspan=3)
-        # Number of subpixels to sample (each pixel has this number of samples)
-        # Note that excessively large values will slow the scan speed down due to
-        # the voltage movement overhead.
-        row += 1
-        tk.Label(settings_frame, text="# of sub-pixels").grid(row=row, column=0)
-        self.subpixel_entry = tk.Entry(settings_frame, width=10)
-        self.subpixel_entry.insert(0, scan_settings['n_subpixels'])
-        self.subpixel_entry.config(state='readonly')
-        self.subpixel_entry.grid(row=row, column=1)
-        # Button to enable repump at start of scan?
-        row += 1
-        tk.Label(settings_frame, text="Reump time (ms)").grid(row=row, column=0)
-        self.repump_entry = tk.Entry(settings_frame, width=10)
-        self.repump_entry.insert(0, scan_settings['time_repump'])
-        self.repump_entry.config(state='readonly')
-        self.repump_entry.grid(row=row, column=1)
+        tk.Label(settings_frame, text="Scan settings", font=named_font(settings_frame, 14)).grid(row=row, column=0, pady=[0,10], columnspan=2)
+        row = _add_scan_settings_entries(self, settings_frame, row+1, scan_settings, readonly=True)
 
         # Scan settings view
         image_settings_frame = tk.Frame(base_frame)
@@ -412,7 +551,7 @@ class DataViewportControlPanel():
         row = 0
         tk.Label(image_settings_frame, 
                  text='Image settings', 
-                 font='Helvetica 14').grid(row=row, column=0, pady=[10,5], columnspan=2)
+                 font=named_font(image_settings_frame, 14)).grid(row=row, column=0, pady=[10,5], columnspan=2)
         # Minimum
         row += 1
         tk.Label(image_settings_frame, text='Minimum (cts/s)').grid(row=row, column=0, padx=5, pady=2)
@@ -1,31 +1,100 @@
+import copy
+import functools
+import hashlib
 import importlib
 import importlib.resources
+import json
 import logging
 import datetime
+import os
+import queue
 import h5py
-from threading import Thread
-
-import matplotlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event, Thread
 
 import nidaqmx
 import numpy as np
 import tkinter as tk
-import yaml
 
 import qdlutils
+from qdlutils.applications.common import load_yaml
 from qdlutils.applications.qdlple.application_gui import (
+    SCAN_SETTINGS_KEYS,
     MainApplicationView,
     ScanPopoutApplicationView,
 )
-from qdlutils.hardware.nidaq.counters.nidaqtimedratecounter import NidaqTimedRateCounter
-
-matplotlib.use('Agg')
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 CONFIG_PATH = 'qdlutils.applications.qdlple.config_files'
 DEFAULT_CONFIG_FILE = 'qdlple_base.yaml'
+SCAN_EVENT_INTERVAL = 33 # Interval in ms to check for events from the scan thread
+
+
+def _config_cache_path(path: str) -> str:
+    '''
+    Returns the path of the JSON cache of the YAML config at `path`. The cache is kept
+    in the user cache directory (not next to the config, which may be read-only).
+    '''
+    if os.name == 'nt':
+        cache_dir = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+    else:
+        cache_dir = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+    name = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    return os.path.join(cache_dir, 'qdlutils', 'qdlple', name + '.json')
+
+@functools.lru_cache(maxsize=8)
+def _load_config(path: str, mtime: int) -> dict:
+    '''
+    Returns the parsed YAML config at `path`. The result is cached on the file path
+    and modification time `mtime` so that reloading an unmodified file skips reading
+    and parsing it.
+
+    The parsed config is also saved as JSON in the user cache directory (see
+    `_config_cache_path()`) and is loaded from there on subsequent launches of the
+    application if the YAML file has not been modified since. Configs which do not
+    survive a JSON round trip unchanged (e.g. with integer keys or dates) are not
+    cached. The JSON cache is skipped if it cannot be read or written.
+    '''
+    cache_path = _config_cache_path(path)
+    try:
+        with open(cache_path, 'r') as file:
+            cache = json.load(file)
+        if cache['mtime'] == mtime:
+            return cache['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    config = load_yaml(path)
+
+    # Check that the config is loaded back from JSON unchanged
+    try:
+        text = json.dumps({'mtime': mtime, 'config': config})
+        cacheable = (json.loads(text)['config'] == config)
+    except (TypeError, ValueError):
+        cacheable = False
+    if not cacheable:
+        logger.debug(f'Not caching config {path}: not representable as JSON')
+        return config
+
+    # Write to a temporary file first so that the cache is never partially written
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w') as file:
+            file.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f'Unable to write config cache {cache_path}: {e}')
+    return config
+
+def _read_config(path: str) -> dict:
+    '''
+    Returns a copy of the parsed YAML config at `path` (so that the cached config
+    cannot be modified by the caller).
+    '''
+    return copy.deepcopy(_load_config(str(path), os.stat(path).st_mtime_ns))
 
 
 class MainTkApplication():
@@ -46,14 +115,27 @@ class MainTkApplication():
         self.wavelength_controller_model = None
         self.data_acquisition_models = {}
         self.auxiliary_control_models = {}
+        self._repump = None # The 'RepumpController' auxiliary controller (if configured)
         self.application_controller_constructor = None
-        self.scan_thread = None
+        # Classes referenced by the YAML configs, keyed by (import path, class name)
+        self._class_cache = {}
+        # Scans are run on a single long-lived worker thread. Scan windows are posted to
+        # `self.scan_jobs` to be run and `None` stops the worker.
+        self.scan_jobs = queue.Queue()
+        self.scan_active = Event() # Set while a scan is queued or running
+        self.scan_thread = Thread(target=self.scan_worker_function, daemon=True)
+        self.scan_thread.start()
+        # Queue of events posted by the scan thread
+        self.scan_queue = queue.Queue()
+        # Holds only the latest scan with new data to display (older ones are dropped)
+        self.render_slot = queue.Queue(maxsize=1)
 
         # List to keep track of child scan windows
         self.scan_windows = []
         self.current_scan = None
         self.number_scans_on_session = 0 # The number of scans performed
         self.last_save_directory = 'C:/Users/Fu Lab NV PC/Documents' # Modify this for your system
+        self.png_dpi = 150 # Resolution of the saved PNG images, modify as needed
 
         # Load the YAML file based off of `controller_name`
         self.load_controller_from_name(yaml_filename=default_config_filename)
@@ -75,6 +157,8 @@ class MainTkApplication():
         self.view.control_panel.get_button.bind("<Button>", self.update_voltage_show)
         self.view.control_panel.hardware_config_from_yaml_button.bind("<Button>", lambda e: self.configure_from_yaml())
         self.view.control_panel.repump_laser_toggle.config(command=self.toggle_repump_laser)
+        # Buttons disabled while the hardware is in use
+        self._buttons = (self.view.control_panel.start_button, self.view.control_panel.goto_button)
 
         # Turn off the repump laser at startup
         self.toggle_repump_laser(cmd=False)
@@ -123,25 +207,16 @@ class MainTkApplication():
         Also functions as a directly callable function in the code 
         by passing the boolean `on` variable.
         '''
-        # Check if the application has a repump controller
-        if 'RepumpController' in self.auxiliary_control_models:
-
-            # If the GUI toggle is on and no direct command `cmd` given
-            # OR if the direct command is True then turn on the laser
-            if ((self.view.control_panel.repump_laser_on.get() == 1) and cmd is None) or (cmd is True):
-                logger.info('Turning repump laser on.')
-                self.disable_buttons()
-                self.auxiliary_control_models['RepumpController'].go_to_voltage(
-                    voltage=self.auxiliary_control_models['RepumpController'].max_voltage)
-                self.enable_buttons()
-            # Else if the GUI toggle is off and no direct command is given
-            # OR if the direct command is False then turn off the laser
-            elif ((self.view.control_panel.repump_laser_on.get() == 0) and cmd is None) or (cmd is False):
-                logger.info('Turning repump laser off.')
-                self.disable_buttons()
-                self.auxiliary_control_models['RepumpController'].go_to_voltage(
-                    voltage=self.auxiliary_control_models['RepumpController'].min_voltage)
-                self.enable_buttons()
+        # Nothing to do if the application has no repump controller
+        repump = self._repump
+        if repump is None:
+            return
+        # Use the GUI toggle if no direct command `cmd` is given
+        on = cmd if cmd is not None else (self.view.control_panel.repump_laser_on.get() == 1)
+        logger.info(f'Turning repump laser {"on" if on else "off"}.')
+        self.disable_buttons()
+        repump.go_to_voltage(voltage=repump.max_voltage if on else repump.min_voltage)
+        self.enable_buttons()
 
     def start_scan(self, event=None) -> None:
         '''
@@ -150,11 +225,13 @@ class MainTkApplication():
         This function runs the actual scan.
         It first collects the scan settings from the GUI inputs and performs
         the calculations for the scan inputs.
-        It then launches a Thread which runs the scanning function to avoid 
-        locking up the GUI during the scan.
+        It then posts the scan to the scan thread which runs the scanning function
+        to avoid locking up the GUI during the scan.
         '''
-        if self.current_scan is not None and self.current_scan.application_controller.running:
-            return # Catch accidential trigger during scan?
+        # Ignore triggers while a scan is queued or running (the button still receives
+        # clicks while disabled)
+        if self.scan_active.is_set():
+            return
         
         # Turn off the repump laser
         self.toggle_repump_laser(cmd=False)
@@ -199,9 +276,11 @@ class MainTkApplication():
         # Disable the buttons
         self.disable_buttons()
 
-        # Launch the thread
-        self.scan_thread = Thread(target=self.scan_thread_function)
-        self.scan_thread.start()
+        # Run the scan on the scan thread
+        self.scan_active.set()
+        self.scan_jobs.put(self.current_scan)
+        # Handle the scan thread events on the main thread
+        self.root.after(SCAN_EVENT_INTERVAL, self.process_scan_events)
 
     def stop_scan(self, event=None) -> None:
         '''
@@ -214,32 +293,87 @@ class MainTkApplication():
         #self.current_scan.application_controller.stop()
         self.enable_buttons()
 
-    def scan_thread_function(self) -> None:
+    def scan_worker_function(self) -> None:
+        '''
+        Target of the scan thread. Runs each scan posted to `self.scan_jobs` in turn
+        until `None` is posted.
+        '''
+        while True:
+            scan = self.scan_jobs.get()
+            if scan is None:
+                break
+            # Keep the worker alive for the next scan if this one fails unexpectedly,
+            # the GUI is still notified by `self.scan_thread_function()`
+            try:
+                self.scan_thread_function(scan)
+            except Exception:
+                logger.exception('Unexpected error during scan.')
+
+    def scan_thread_function(self, scan) -> None:
         '''
         Function to be called in background thread.
 
-        Runs the scans and updates the figure.
+        Runs the scans of the scan window `scan` and notifies the GUI of each 
+        completed scan.
         '''
         
+        # The GUI is not modified from this thread, instead events are posted to
+        # `self.scan_queue` and handled on the main thread by `self.process_scan_events()`
+        finished_event = 'error'
         try:
-            self.current_scan.application_controller.start()  # starts the DAQ
-
-            while self.current_scan.application_controller.still_scanning():
-                self.current_scan.application_controller.scan_wavelengths()
-                self.current_scan.view.data_viewport.update_figure(self.current_scan.application_controller)
-                self.current_scan.view.canvas.draw()
-
-            # Set repump to toggle value
-            self.toggle_repump_laser()
+            scan.application_controller.start()  # starts the DAQ
+
+            while scan.application_controller.still_scanning():
+                scan.application_controller.scan_wavelengths()
+                # Notify the GUI that a new scan has been completed, replacing any
+                # notification the GUI has not yet handled
+                try:
+                    self.render_slot.get_nowait()
+                except queue.Empty:
+                    pass
+                self.render_slot.put_nowait(scan)
 
             logger.info('Scan complete.')
-            self.current_scan.application_controller.stop()
+            scan.application_controller.stop()
+            finished_event = 'complete'
 
         except nidaqmx.errors.DaqError as e:
             logger.info(e)
             logger.info(
                 'Check for other applications using resources. If not, you may need to restart the application.')
 
+        finally:
+            # Always notify the GUI that the scan has finished
+            self.scan_active.clear()
+            self.scan_queue.put((finished_event, scan))
+
+    def process_scan_events(self) -> None:
+        '''
+        Handles the events posted by the scan thread. The figure is updated for the
+        latest scan in `self.render_slot` (if any) and the scan is finalized once the
+        thread posts its final event to `self.scan_queue`. Reschedules itself until the
+        scan thread finishes.
+        '''
+        try:
+            finished_event, _ = self.scan_queue.get_nowait()
+        except queue.Empty:
+            finished_event = None
+        try:
+            updated_scan = self.render_slot.get_nowait()
+        except queue.Empty:
+            updated_scan = None
+
+        # Update the figure if the scan window is still open
+        if (updated_scan is not None) and updated_scan.root.winfo_exists():
+            updated_scan.view.data_viewport.update_figure(updated_scan.application_controller)
+
+        if finished_event is None:
+            self.root.after(SCAN_EVENT_INTERVAL, self.process_scan_events)
+            return
+
+        if finished_event == 'complete':
+            # Set repump to toggle value
+            self.toggle_repump_laser()
         self.enable_buttons()
 
     def configure_from_yaml(self, afile=None) -> None:
@@ -265,18 +399,14 @@ class MainTkApplication():
             afile = tk.filedialog.askopenfile(filetypes=filetypes, defaultextension='.yaml')
             if afile is None:
                 return  # selection was canceled.
-            # Log selection
-            logger.info(f"Loading settings from: {afile}")
-            # Retrieve the file in a dictionary `config`
-            config = yaml.safe_load(afile)
+            # Only the path is needed, the file is read by `_read_config()`
             afile.close()
-        else:
-            # Else, open the provided file and load the YAML
-            # Currently there is no protection against invalid YAML configs
-            with open(afile, 'r') as file:
-                # Log selection
-                logger.info(f"Loading settings from: {afile}")
-                config = yaml.safe_load(file)
+            afile = afile.name
+        # Log selection
+        logger.info(f"Loading settings from: {afile}")
+        # Retrieve the file in a dictionary `config`
+        # Currently there is no protection against invalid YAML configs
+        config = _read_config(afile)
 
         # At this point the `config` variable is a dictionary of 
         # nested dictionaries corresponding to each indent level in the YAML.
@@ -288,11 +418,8 @@ class MainTkApplication():
         appl_ctrl_import_path = config[APPLICATION_NAME]['ApplicationController']['import_path']
         appl_ctrl_class_name = config[APPLICATION_NAME]['ApplicationController']['class_name']
         # Now we create a constructor for the aplication controller class
-        # Import the application controller module
-        module = importlib.import_module(appl_ctrl_import_path)
-        logger.debug(f"Importing {appl_ctrl_import_path}")
         # Get the class constructor and write it to main
-        self.application_controller_constructor = getattr(module, appl_ctrl_class_name)
+        self.application_controller_constructor = self._resolve(appl_ctrl_import_path, appl_ctrl_class_name)
         
 
         # The import paths and class names for the controllers and readers
@@ -322,54 +449,45 @@ class MainTkApplication():
 
         # Now that we have their names we can retrieve their import paths
         # and class names from the YAML, along with their configurations.
-        # We then can instantiate the controllers and readers and store them
-        # within the application instance.
-        # First get the dictionary containing the controller configuration
-        controller_model_yaml_dict = config[APPLICATION_NAME][controller_name]
-
-        # Import the controller model module
-        module = importlib.import_module(controller_model_yaml_dict['import_path'])
-        logger.debug(f"Importing {controller_model_yaml_dict['import_path']}")
-        # Get the class generator
-        controller_class = getattr(module, controller_model_yaml_dict['class_name'])
-        # Instantiate the class 
-        self.wavelength_controller_model = controller_class(logger.level)
-        # Configure using the YAML config
-        self.wavelength_controller_model.configure(controller_model_yaml_dict['configure'])
-
-        # Repeat for each of the readers, store in MainTkApplication.data_acquisition_models
-        for reader in reader_names:
-            # First get the dictionary containing the controller configuration
-            reader_model_yaml_dict = config[APPLICATION_NAME][reader]
-            # Import the controller model module
-            module = importlib.import_module(reader_model_yaml_dict['import_path'])
-            logger.debug(f"Importing {reader_model_yaml_dict['import_path']}")
-            # Get the class generator
-            reader_class = getattr(module, reader_model_yaml_dict['class_name'])
-            # Instantiate the class 
-            reader_model = reader_class(logger.level)
-            # Configure using the YAML config
-            reader_model.configure(reader_model_yaml_dict['configure'])
-            # Save to data_acquisition_models
+        # We first collect (import path, class name, configuration) for the controller,
+        # readers and auxiliary controllers in that order.
+        names = [controller_name] + reader_names + aux_ctrl_names
+        specs = [(config[APPLICATION_NAME][name]['import_path'],
+                  config[APPLICATION_NAME][name]['class_name'],
+                  config[APPLICATION_NAME][name]['configure']) for name in names]
+
+        # We then can instantiate the controllers and readers, configure them using the
+        # YAML config, and store them within the application instance.
+        models = []
+        for import_path, class_name, configure in specs:
+            model = self._resolve(import_path, class_name)(logger.level)
+            model.configure(configure)
+            models.append(model)
+
+        # The first model is the wavelength controller
+        self.wavelength_controller_model = models[0]
+        # Store the readers in MainTkApplication.data_acquisition_models
+        for reader, reader_model in zip(reader_names, models[1:1+len(reader_names)]):
             self.data_acquisition_models[reader] = reader_model
-
-        # Repeat for each of the auxiliary controllers, store in MainTkApplication.auxiliary_control_models
-        # Repeat for each of the readers
-        for aux_ctrl in aux_ctrl_names:
-            # First get the dictionary containing the controller configuration
-            aux_ctrl_model_yaml_dict = config[APPLICATION_NAME][aux_ctrl]
-            # Import the controller model module
-            module = importlib.import_module(aux_ctrl_model_yaml_dict['import_path'])
-            logger.debug(f"Importing {aux_ctrl_model_yaml_dict['import_path']}")
-            # Get the class generator
-            aux_ctrl_class = getattr(module, aux_ctrl_model_yaml_dict['class_name'])
-            # Instantiate the class 
-            aux_ctrl_model = aux_ctrl_class(logger.level)
-            # Configure using the YAML config
-            aux_ctrl_model.configure(aux_ctrl_model_yaml_dict['configure'])
-            # Save to auxiliary_control_models
+        # Store the auxiliary controllers in MainTkApplication.auxiliary_control_models
+        for aux_ctrl, aux_ctrl_model in zip(aux_ctrl_names, models[1+len(reader_names):]):
             self.auxiliary_control_models[aux_ctrl] = aux_ctrl_model
+        self._repump = self.auxiliary_control_models.get('RepumpController')
+
 
+    def _resolve(self, import_path: str, class_name: str) -> type:
+        '''
+        Returns the class `class_name` from the module at `import_path`. The class is
+        cached so that the module is only imported once per session, even if the 
+        configuration is reloaded.
+        '''
+        key = (import_path, class_name)
+        cls = self._class_cache.get(key)
+        if cls is None:
+            logger.debug(f"Importing {import_path}")
+            cls = getattr(importlib.import_module(import_path), class_name)
+            self._class_cache[key] = cls
+        return cls
 
     def load_controller_from_name(self, yaml_filename: str) -> None:
         '''
@@ -382,26 +500,18 @@ class MainTkApplication():
         self.configure_from_yaml(str(yaml_path))
 
     def disable_buttons(self):
-        self.view.control_panel.start_button['state'] = 'disabled'
-        self.view.control_panel.goto_button['state'] = 'disabled'
-        try:
-            self.current_scan.view.control_panel.save_scan_button.config(state=tk.DISABLED)
-        except Exception as e:
-            if self.current_scan is not None:
-                logger.debug('Exception caught disabling buttons')
-                logger.debug(e)
-                pass
+        for button in self._buttons:
+            button['state'] = 'disabled'
+        # The scan window may have already been closed
+        if (self.current_scan is not None) and self.current_scan.root.winfo_exists():
+            self.current_scan.save_scan_button.config(state=tk.DISABLED)
 
     def enable_buttons(self):
-        self.view.control_panel.start_button['state'] = 'normal'
-        self.view.control_panel.goto_button['state'] = 'normal'
-        try:
-            self.current_scan.view.control_panel.save_scan_button.config(state=tk.NORMAL)
-        except Exception as e:
-            if self.current_scan is not None:
-                logger.debug('Exception caught enabling buttons')
-                logger.debug(e)
-                pass
+        for button in self._buttons:
+            button['state'] = 'normal'
+        # The scan window may have already been closed
+        if (self.current_scan is not None) and self.current_scan.root.winfo_exists():
+            self.current_scan.save_scan_button.config(state=tk.NORMAL)
 
 
     def run(self) -> None:
@@ -421,7 +531,7 @@ class MainTkApplication():
         '''
         This function handles closing the application.
         '''
-        if (self.scan_thread is not None) and (self.scan_thread.is_alive()):
+        if self.scan_active.is_set():
             if tk.messagebox.askokcancel(
                     'Warning', 
                     'Scan is currently running and may not close properly.'
@@ -429,10 +539,12 @@ class MainTkApplication():
                 logger.warning('Forcing application closure.')
 
                 # Close the application out
+                self.scan_jobs.put(None) # Stop the scan thread after the running scan
                 self.toggle_repump_laser(cmd=True) # Turn the repump laser back on
                 self.root.destroy()
                 self.root.quit()
         else:
+            self.scan_jobs.put(None) # Stop the scan thread
             self.toggle_repump_laser(cmd=True)
             self.root.destroy()
             self.root.quit()
@@ -446,49 +558,87 @@ class ScanPopoutApplication():
     application_controller, handles events for controlling the view port and
     saving data for a set of scans.
     '''
+
+    # Scan settings saved to the HDF5 file under `scan_settings/` as (attribute name,
+    # units, description). If your implementation settings vary you should edit these.
+    SCAN_SETTINGS_DATASETS = (
+        ('min', 'Volts', 'Minimum scan voltage'),
+        ('max', 'Volts', 'Maximum scan voltage'),
+        # Pixel settings
+        ('n_pixels_up', 'None', 'Number of pixels on upsweep'),
+        ('n_pixels_down', 'None', 'Number of pixels on downsweep'),
+        ('n_subpixels', 'None', 'Number of subpixel samples per pixel'),
+        ('n_scans', 'None', 'Number of scans requested'),
+        # Time settings
+        ('time_up', 'Seconds', 'Total time for upsweep'),
+        ('time_down', 'Seconds', 'Total time for downsweep'),
+        ('time_repump', 'Milliseconds', 'Time for repump at start of scan'),
+        # Derived settings
+        ('pixel_step_size_up', 'Volts', 'Voltage step size between pixels on upsweep'),
+        ('pixel_step_size_down', 'Volts', 'Voltage step size between pixels on downsweep'),
+        ('sample_step_size_up', 'Volts', 'Voltage step size between samples on upsweep'),
+        ('sample_step_size_down', 'Volts', 'Voltage step size between samples on downsweep'),
+        ('pixel_time_up', 'Seconds', 'Total time per pixel on upsweep'),
+        ('pixel_time_down', 'Seconds', 'Total time per pixel on downsweep'),
+        ('sample_time_up', 'Seconds', 'Integration time per sample on upsweep'),
+        ('sample_time_down', 'Seconds', 'Integration time per sample on downsweep'),
+    )
+    # Voltage arrays saved to the HDF5 file under `data/`
+    SCAN_DATA_DATASETS = (
+        ('pixel_voltages_up', 'Volts', 'Voltage value at start of each pixel on upsweep'),
+        ('pixel_voltages_down', 'Volts', 'Voltage value at start of each pixel on downsweep'),
+        ('sample_voltages_up', 'Volts', 'Voltage value at sample points on upsweep'),
+        ('sample_voltages_down', 'Volts', 'Voltage value at sample points on downsweep'),
+    )
+    # Filters applied to the array datasets under `data/`. The shuffle filter groups
+    # the bytes of the floating point values which improves the compression ratio.
+    # Gzip (unlike LZF) can be read by any HDF5 reader, and level 1 is nearly as fast
+    # as LZF. Increase `compression_opts` (up to 9) for smaller but slower saves.
+    HDF5_ARRAY_FILTERS = {'compression': 'gzip', 'compression_opts': 1, 'shuffle': True}
+    # Target size in bytes of the image dataset chunks. Chunks span whole scans so 
+    # that reading back a single scan only decompresses one small chunk.
+    HDF5_CHUNK_BYTES = 64*1024
+    # Raw data chunk cache used when writing the HDF5 file. Each chunk spans whole
+    # scans and is written by a single call so the cache only needs to hold a few
+    # chunks. It holds 16 chunks of `HDF5_CHUNK_BYTES` (1 MiB) with a prime number of
+    # hash slots about 100 times the number of chunks. Since every chunk is written only
+    # once, fully written chunks are evicted first (`rdcc_w0=1`).
+    HDF5_CHUNK_CACHE = {'rdcc_nbytes': 16*HDF5_CHUNK_BYTES, 'rdcc_nslots': 1601, 'rdcc_w0': 1.0}
+
     def __init__(self, parent_application, application_controller, id: str = '') -> None:
         # Store the application controller and number identifier
         self.parent_application = parent_application
         self.application_controller = application_controller
         self.id = id
         self.timestamp = datetime.datetime.now()
+        # Formatted timestamps for the window title/metadata and the default file name
+        self.ts_iso = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        self.ts_date = self.timestamp.strftime("%Y%m%d")
         
 
         # First load meta/config data from the application controller
-        self.min = application_controller.min
-        self.max = application_controller.max
-        self.n_pixels_up = application_controller.n_pixels_up
-        self.n_pixels_down = application_controller.n_pixels_down
-        self.n_subpixels = application_controller.n_subpixels
-        self.time_up = application_controller.time_up
-        self.time_down = application_controller.time_down
-        self.n_scans = application_controller.n_scans
-        self.time_repump = application_controller.time_repump
-        self.pixel_step_size_up = application_controller.pixel_step_size_up
-        self.pixel_step_size_down = application_controller.pixel_step_size_down
-        self.sample_step_size_up = application_controller.sample_step_size_up
-        self.sample_step_size_down = application_controller.sample_step_size_down
-        self.pixel_voltages_up = application_controller.pixel_voltages_up
-        self.pixel_voltages_down = application_controller.pixel_voltages_down
-        self.sample_voltages_up = application_controller.sample_voltages_up
-        self.sample_voltages_down = application_controller.sample_voltages_down
-        self.pixel_time_up = application_controller.pixel_time_up
-        self.pixel_time_down = application_controller.pixel_time_down
-        self.sample_time_up = application_controller.sample_time_up
-        self.sample_time_down = application_controller.sample_time_down
+        self.__dict__.update(application_controller.snapshot())
 
         # Then initialize the GUI
         self.root = tk.Toplevel()
-        self.root.title(f'Scan {id} ({self.timestamp.strftime("%Y-%m-%d %H:%M:%S")})')
-        self.view = ScanPopoutApplicationView(main_frame=self.root, scan_settings=self.__dict__)
+        self.root.title(f'Scan {id} ({self.ts_iso})')
+        # Only the displayed settings are passed to the view (not the voltage arrays or
+        # the application controller)
+        scan_settings = {key: getattr(self, key) for key in SCAN_SETTINGS_KEYS}
+        self.view = ScanPopoutApplicationView(main_frame=self.root, scan_settings=scan_settings)
 
         # Bind the buttons to callbacks
-        self.view.control_panel.save_scan_button.bind("<Button>", self.save_data)
+        self.save_scan_button = self.view.control_panel.save_scan_button
+        self.save_scan_button.bind("<Button>", self.save_data)
         self.view.control_panel.norm_button.bind("<Button>", self.set_normalize)
         self.view.control_panel.autonorm_button.bind("<Button>", self.auto_normalize)
 
         self.view.control_panel.integrate_scans_toggle.config(command=self.toggle_integrate)
 
+        # Single worker thread to write the data files so that the GUI remains responsive
+        # while saving. Successive saves are written in the order they were requested.
+        self._save_pool = ThreadPoolExecutor(max_workers=1)
+
         # Set the behavior on clsing the window, launch main loop for window
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
@@ -497,10 +647,10 @@ class ScanPopoutApplication():
         Method to save the data, you can add more logic later for other filetypes.
         The event input is to catch the tkinter event that is supplied but not used.
         '''
-        allowed_formats = [('Image with dataset', '*.png'), ('Dataset', '*.hdf5')]
+        allowed_formats = [('Image with dataset', '*.png'), ('Dataset', '*.hdf5'), ('NumPy arrays', '*.npz')]
 
         # Default filename
-        default_name = f'scan{self.id}_{self.timestamp.strftime("%Y%m%d")}'
+        default_name = f'scan{self.id}_{self.ts_date}'
             
         # Get the savefile name
         afile = tk.filedialog.asksaveasfilename(filetypes=allowed_formats, 
@@ -512,26 +662,58 @@ class ScanPopoutApplication():
             return # selection was canceled.
 
         # Get the path
-        file_path = '/'.join(afile.split('/')[:-1])  + '/'
-        self.parent_application.last_save_directory = file_path # Save the last used file path
-        logger.info(f'Saving files to directory: {file_path}')
-        # Get the name with extension (will be overwritten)
-        file_name = afile.split('/')[-1]
-        # Get the filetype
-        file_type = file_name.split('.')[-1]
-        # Get the filename without extension
-        file_name = '.'.join(file_name.split('.')[:-1]) # Gets everything but the extension
+        directory, file_name = os.path.split(afile)
+        self.parent_application.last_save_directory = directory # Save the last used file path
+        logger.info(f'Saving files to directory: {directory}')
+        # Get the filename without extension and the filetype
+        file_name, file_type = os.path.splitext(file_name)
+        file_type = file_type.lstrip('.').lower()
 
         # If the file type is .png, want to save image and hdf5
         if file_type == 'png':
             logger.info(f'Saving the PNG as {file_name}.png')
             fig = self.view.data_viewport.fig
-            fig.savefig(file_path+file_name+'.png', dpi=300, bbox_inches=None, pad_inches=0)
+            # The PNG is written with fast (light) zlib compression
+            fig.savefig(os.path.join(directory, file_name+'.png'), 
+                        dpi=self.parent_application.png_dpi, 
+                        metadata={'Software': f'qdlutils {qdlutils.__version__}'},
+                        pil_kwargs={'optimize': False, 'compress_level': 1})
+
+        # Get the full image data
+        # This is taken here (on the main thread) since the scan thread may still be
+        # adding scans to the application controller. Only the completed scans are used.
+        for reader in self.application_controller.scan_images:
+            img_data = self.application_controller.get_image(reader)
+
+        # Save as npz if requested, otherwise as hdf5 (on the save thread)
+        if file_type == 'npz':
+            write_file, extension = self._write_npz, '.npz'
+        else:
+            write_file, extension = self._write_hdf5, '.hdf5'
+        future = self._save_pool.submit(write_file, os.path.join(directory, file_name+extension), file_name, img_data)
+        self.root.after(SCAN_EVENT_INTERVAL, self._check_save, future, file_name+extension)
 
-        # Save as hdf5
-        with h5py.File(file_path+file_name+'.hdf5', 'w') as df:
+    def _check_save(self, future: Future, file_name: str) -> None:
+        '''
+        Polls the `future` of a save submitted by `save_data` from the main thread and 
+        logs the result when it has finished.
+        '''
+        if not future.done():
+            self.root.after(SCAN_EVENT_INTERVAL, self._check_save, future, file_name)
+            return
+        if future.exception() is not None:
+            logger.error(f'Error saving {file_name}: {future.exception()}')
+        else:
+            logger.info(f'Saved {file_name}')
+
+    def _write_hdf5(self, path: str, original_name: str, img_data: np.ndarray) -> None:
+        '''
+        Writes the scan settings and the image data `img_data` to the HDF5 file at 
+        `path`. This is run on the save thread and so must not access the GUI.
+        '''
+        with h5py.File(path, 'w', **self.HDF5_CHUNK_CACHE) as df:
             
-            logger.info(f'Saving the HDF5 as {file_name}.hdf5')
+            logger.info(f'Saving the HDF5 as {original_name}.hdf5')
             
             # Save the file metadata
             ds = df.create_dataset('file_metadata', 
@@ -543,97 +725,100 @@ class ScanPopoutApplication():
             ds.attrs['application'] = 'qdlutils.qdlple'
             ds.attrs['qdlutils_version'] = qdlutils.__version__
             ds.attrs['scan_id'] = self.id
-            ds.attrs['timestamp'] = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            ds.attrs['original_name'] = file_name
-
-            # Save the scan settings
-            # If your implementation settings vary you should change the attrs
-            ds = df.create_dataset('scan_settings/min', data=self.min)
-            ds.attrs['units'] = 'Volts'
-            ds.attrs['description'] = 'Minimum scan voltage'
-            ds = df.create_dataset('scan_settings/max', data=self.max)
-            ds.attrs['units'] = 'Volts'
-            ds.attrs['description'] = 'Maximum scan voltage'
-            # Pixel settings
-            ds = df.create_dataset('scan_settings/n_pixels_up', data=self.n_pixels_up)
-            ds.attrs['units'] = 'None'
-            ds.attrs['description'] = 'Number of pixels on upsweep'
-            ds = df.create_dataset('scan_settings/n_pixels_down', data=self.n_pixels_down)
-            ds.attrs['units'] = 'None'
-            ds.attrs['description'] = 'Number of pixels on downsweep'
-            ds = df.create_dataset('scan_settings/n_subpixels', data=self.n_subpixels)
-            ds.attrs['units'] = 'None'
-            ds.attrs['description'] = 'Number of subpixel samples per pixel'
-            ds = df.create_dataset('scan_settings/n_scans', data=self.n_scans)
-            ds.attrs['units'] = 'None'
-            ds.attrs['description'] = 'Number of scans requested'
-            # Time settings
-            ds = df.create_dataset('scan_settings/time_up', data=self.time_up)
-            ds.attrs['units'] = 'Seconds'
-            ds.attrs['description'] = 'Total time for upsweep'
-            ds = df.create_dataset('scan_settings/time_down', data=self.time_down)
-            ds.attrs['units'] = 'Seconds'
-            ds.attrs['description'] = 'Total time for downsweep'
-            ds = df.create_dataset('scan_settings/time_repump', data=self.time_repump)
-            ds.attrs['units'] = 'Milliseconds'
-            ds.attrs['description'] = 'Time for repump at start of scan'
-            # Derived settings
-            ds = df.create_dataset('scan_settings/pixel_step_size_up', data=self.pixel_step_size_up)
-            ds.attrs['units'] = 'Volts'
-            ds.attrs['description'] = 'Voltage step size between pixels on upsweep'
-            ds = df.create_dataset('scan_settings/pixel_step_size_down', data=self.pixel_step_size_down)
-            ds.attrs['units'] = 'Volts'
-            ds.attrs['description'] = 'Voltage step size between pixels on downsweep'
-            ds = df.create_dataset('scan_settings/sample_step_size_up', data=self.sample_step_size_up)
-            ds.attrs['units'] = 'Volts'
-            ds.attrs['description'] = 'Voltage step size between samples on upsweep'
-            ds = df.create_dataset('scan_settings/sample_step_size_down', data=self.sample_step_size_down)
-            ds.attrs['units'] = 'Volts'
-            ds.attrs['description'] = 'Voltage step size between samples on downsweep'
-            ds = df.create_dataset('scan_settings/pixel_time_up', data=self.pixel_time_up)
-            ds.attrs['units'] = 'Seconds'
-            ds.attrs['description'] = 'Total time per pixel on upsweep'
-            ds = df.create_dataset('scan_settings/pixel_time_down', data=self.pixel_time_down)
-            ds.attrs['units'] = 'Seconds'
-            ds.attrs['description'] = 'Total time per pixel on downsweep'
-            ds = df.create_dataset('scan_settings/sample_time_up', data=self.sample_time_up)
-            ds.attrs['units'] = 'Seconds'
-            ds.attrs['description'] = 'Integration time per sample on upsweep'
-            ds = df.create_dataset('scan_settings/sample_time_down', data=self.sample_time_down)
-            ds.attrs['units'] = 'Seconds'
-            ds.attrs['description'] = 'Integration time per sample on downsweep'
-
-            # Create the primary datasets
-            ds = df.create_dataset('data/pixel_voltages_up', data=self.pixel_voltages_up)
-            ds.attrs['units'] = 'Volts'
-            ds.attrs['description'] = 'Voltage value at start of each pixel on upsweep'
-            ds = df.create_dataset('data/pixel_voltages_down', data=self.pixel_voltages_down)
-            ds.attrs['units'] = 'Volts'
-            ds.attrs['description'] = 'Voltage value at start of each pixel on downsweep'
-            ds = df.create_dataset('data/sample_voltages_up', data=self.sample_voltages_up)
-            ds.attrs['units'] = 'Volts'
-            ds.attrs['description'] = 'Voltage value at sample points on upsweep'
-            ds = df.create_dataset('data/sample_voltages_down', data=self.sample_voltages_down)
-            ds.attrs['units'] = 'Volts'
-            ds.attrs['description'] = 'Voltage value at sample points on downsweep'
-
-            # Get the full image data
-            # Maybe can remove if we update image data at the popout window level?
-            for reader in self.application_controller.readers:
-                if isinstance(self.application_controller.readers[reader], NidaqTimedRateCounter):
-                    img_data = np.array([output[reader] for output in self.application_controller.outputs])
+            ds.attrs['timestamp'] = self.ts_iso
+            ds.attrs['original_name'] = original_name
+
+            # Save the scan settings and the primary datasets
+            # If your implementation settings vary you should change the attrs in
+            # `SCAN_SETTINGS_DATASETS` and `SCAN_DATA_DATASETS`
+            # The scalar settings cannot be chunked so only the data arrays are filtered
+            for group_name, datasets, options in (
+                    ('scan_settings', self.SCAN_SETTINGS_DATASETS, {}), 
+                    ('data', self.SCAN_DATA_DATASETS, {'chunks': True, **self.HDF5_ARRAY_FILTERS})):
+                group = df.require_group(group_name)
+                for name, units, description in datasets:
+                    ds = group.create_dataset(name, data=getattr(self, name), **options)
+                    ds.attrs.update({'units': units, 'description': description})
+
             # Write the image data to file
-            ds = df.create_dataset('data/scan_counts', data=img_data)
-            ds.attrs['units'] = 'Counts/second'
-            ds.attrs['description'] = ('2-d array of counts per second at each pixel of the completed scans.'
-                                      +' Each row consists of one upscan and downscan pair, appended in order.'
-                                      +' The scans are ordered from oldest to newest.')
-            ds = df.create_dataset('data/upscan_counts', data=[scan[:self.n_pixels_up] for scan in img_data])
-            ds.attrs['units'] = 'Counts/second'
-            ds.attrs['description'] = '2-d array of counts per second at each pixel of the upscans only.'
-            ds = df.create_dataset('data/downscan_counts', data=[scan[self.n_pixels_up:] for scan in img_data])
-            ds.attrs['units'] = 'Counts/second'
-            ds.attrs['description'] = '2-d array of counts per second at each pixel of the downscans only.'
+            ds = self._write_image_dataset(df, 'data/scan_counts', img_data)
+            ds.attrs.update({
+                'units': 'Counts/second', 
+                'description': '2-d array of counts per second at each pixel of the completed scans.'
+                               +' Each row consists of one upscan and downscan pair, appended in order.'
+                               +' The scans are ordered from oldest to newest.'})
+            # The upscan and downscan counts are virtual datasets of the corresponding
+            # columns (pixels) of `data/scan_counts` so that the counts are stored once
+            n_up = self.n_pixels_up
+            for name, columns, description in (
+                    ('upscan_counts', np.s_[:n_up],
+                     '2-d array of counts per second at each pixel of the upscans only.'),
+                    ('downscan_counts', np.s_[n_up:],
+                     '2-d array of counts per second at each pixel of the downscans only.')):
+                if img_data.size == 0:
+                    # Empty datasets cannot be mapped
+                    column_ds = self._write_image_dataset(df, 'data/'+name, img_data, columns)
+                else:
+                    layout = h5py.VirtualLayout(shape=img_data[:, columns].shape, dtype=img_data.dtype)
+                    layout[:, :] = h5py.VirtualSource(ds)[:, columns]
+                    column_ds = df.create_virtual_dataset('data/'+name, layout)
+                column_ds.attrs.update({'units': 'Counts/second', 'description': description})
+
+    def _write_npz(self, path: str, original_name: str, img_data: np.ndarray) -> None:
+        '''
+        Writes the voltage arrays and the image data `img_data` to the compressed NumPy 
+        archive at `path` under the same names as the HDF5 `data/` datasets. The file
+        metadata and scan settings are written to a JSON file of the same name. This is
+        run on the save thread and so must not access the GUI.
+        '''
+        logger.info(f'Saving the NPZ as {original_name}.npz')
+        np.savez_compressed(path,
+                            scan_counts=img_data,
+                            upscan_counts=img_data[:, :self.n_pixels_up],
+                            downscan_counts=img_data[:, self.n_pixels_up:],
+                            **{name: getattr(self, name) for name, _, _ in self.SCAN_DATA_DATASETS})
+
+        metadata = {
+            'application': 'qdlutils.qdlple',
+            'qdlutils_version': qdlutils.__version__,
+            'scan_id': self.id,
+            'timestamp': self.ts_iso,
+            'original_name': original_name,
+            'scan_settings': {name: {'value': getattr(self, name), 
+                                     'units': units, 
+                                     'description': description} 
+                              for name, units, description in self.SCAN_SETTINGS_DATASETS},
+        }
+        with open(os.path.splitext(path)[0] + '.json', 'w') as file:
+            json.dump(metadata, file, indent=4, default=str)
+
+    def _write_image_dataset(self, 
+                             df: h5py.File, 
+                             name: str, 
+                             data: np.ndarray, 
+                             columns: slice = np.s_[:]) -> h5py.Dataset:
+        '''
+        Writes the `columns` of the 2-d image array `data` to the dataset `name` of the 
+        file `df` and returns the dataset. The dataset is created with the known shape 
+        and type and the columns are then written directly from the buffer of `data` 
+        (without copying them into a new array first).
+
+        Each chunk spans whole scans (rows) and is sized to roughly `HDF5_CHUNK_BYTES`
+        (at least one scan per chunk). Empty arrays are left contiguous since they 
+        cannot be chunked.
+        '''
+        data = np.ascontiguousarray(data)
+        if data.size == 0:
+            return df.create_dataset(name, data=data[:, columns])
+        n_rows, n_pixels = data[:, columns].shape
+        chunk_rows = min(n_rows, max(1, self.HDF5_CHUNK_BYTES // (n_pixels * data.dtype.itemsize)))
+        ds = df.create_dataset(name, 
+                               shape=(n_rows, n_pixels), 
+                               dtype=data.dtype, 
+                               chunks=(chunk_rows, n_pixels), 
+                               **self.HDF5_ARRAY_FILTERS)
+        ds.write_direct(data, source_sel=np.s_[:, columns])
+        return ds
 
     def set_normalize(self, tkinter_event: tk.Event = None) -> None:
         '''
@@ -654,7 +839,6 @@ class ScanPopoutApplication():
         self.view.data_viewport.norm_max = norm_max
 
         self.view.data_viewport.update_figure(self.application_controller)
-        self.view.canvas.draw()
 
     def auto_normalize(self, tkinter_event: tk.Event = None) -> None:   
         '''
@@ -665,7 +849,6 @@ class ScanPopoutApplication():
         self.view.data_viewport.norm_max = None
 
         self.view.data_viewport.update_figure(self.application_controller)
-        self.view.canvas.draw()
 
     def toggle_integrate(self):
         # Check if the checkbox is checked in the GUI
@@ -677,7 +860,6 @@ class ScanPopoutApplication():
         try:
             # Update the figure
             self.view.data_viewport.update_figure(self.application_controller)
-            self.view.canvas.draw()
         except Exception as e:
             logger.warning(f'Error in toggling: {e}')
 
@@ -698,14 +880,17 @@ class ScanPopoutApplication():
         if self.application_controller.still_scanning():
             logger.warning('Scan window closed while active. Verify scanning has stopped.')
             self.parent_application.stop_scan()
+        # Finish any pending saves in the background
+        self._save_pool.shutdown(wait=False)
         self.root.destroy()
 
 
-def main(is_root_process=True) -> None:
+def main(is_root_process=True) -> MainTkApplication:
     tkapp = MainTkApplication(
         default_config_filename=DEFAULT_CONFIG_FILE,
         is_root_process=is_root_process)
     tkapp.run()
+    return tkapp
 
 
 if __name__ == '__main__':
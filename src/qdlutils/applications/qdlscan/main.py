@@ -7,11 +7,11 @@ import h5py
 
 from threading import Thread
 import tkinter as tk
-import yaml
 
 from scipy.optimize import curve_fit
 
 import qdlutils
+from qdlutils.applications.common import load_yaml
 from qdlutils.applications.qdlscan.application_controller import ScanController
 from qdlutils.applications.qdlscan.application_gui import (
     LauncherApplicationView,
@@ -164,11 +164,10 @@ class LauncherApplication:
         afile: str
             Full-path filename of the YAML config file.
         '''
-        with open(afile, 'r') as file:
-            # Log selection
-            logger.info(f"Loading settings from: {afile}")
-            # Get the YAML config as a nested dict
-            config = yaml.safe_load(file)
+        # Log selection
+        logger.info(f"Loading settings from: {afile}")
+        # Get the YAML config as a nested dict
+        config = load_yaml(afile)
 
         # First we get the top level application name
         APPLICATION_NAME = list(config.keys())[0]
@@ -1332,11 +1331,12 @@ class ImageScanApplication():
         self.view.update_figure()
 
 
-def main(is_root_process=True):
+def main(is_root_process=True) -> LauncherApplication:
     tkapp = LauncherApplication(
         default_config_filename=DEFAULT_CONFIG_FILE,
         is_root_process=is_root_process)
     tkapp.run()
+    return tkapp
 
 if __name__ == '__main__':
     main()
@@ -8,9 +8,9 @@ import time
 
 from threading import Thread
 import tkinter as tk
-import yaml
 
 import qdlutils
+from qdlutils.applications.common import load_yaml
 from qdlutils.applications.qdlscope.application_gui import ScopeApplicationView
 
 logger = logging.getLogger(__name__)
@@ -357,11 +357,10 @@ class ScopeApplication:
         afile: str
             Full-path filename of the YAML config file.
         '''
-        with open(afile, 'r') as file:
-            # Log selection
-            logger.info(f"Loading settings from: {afile}")
-            # Get the YAML config as a nested dict
-            config = yaml.safe_load(file)
+        # Log selection
+        logger.info(f"Loading settings from: {afile}")
+        # Get the YAML config as a nested dict
+        config = load_yaml(afile)
 
         # First we get the top level application name
         APPLICATION_NAME = list(config.keys())[0]
@@ -430,11 +429,12 @@ class ScopeApplication:
         }
 
 
-def main(is_root_process=True):
+def main(is_root_process=True) -> ScopeApplication:
     tkapp = ScopeApplication(
         default_config_filename=DEFAULT_CONFIG_FILE,
         is_root_process=is_root_process)
     tkapp.run()
+    return tkapp
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,47 @@
+from qdlutils.applications.qdlmove.main import (
+    POSITIONER_STARTUP,
+    _find_startup,
+    _startup_micrometer,
+    _startup_nidaq,
+)
+
+
+def _stand_in(key: str) -> type:
+    '''
+    Returns a class whose `module.qualname` is `key` without importing the hardware
+    module (which requires the vendor drivers).
+    '''
+    module, _, qualname = key.rpartition('.')
+    return type(qualname, (), {'__module__': module, '__qualname__': qualname})
+
+
+NIDAQ_KEY = 'qdlutils.hardware.nidaq.analogoutputs.nidaqposition.NidaqPositionController'
+MICROMETER_KEY = 'qdlutils.hardware.micrometers.newportmicrometer.NewportMicrometer'
+
+
+def test_startup_table_keys():
+    assert POSITIONER_STARTUP[NIDAQ_KEY] is _startup_nidaq
+    assert POSITIONER_STARTUP[MICROMETER_KEY] is _startup_micrometer
+
+
+def test_find_startup_exact_type():
+    assert _find_startup(_stand_in(NIDAQ_KEY)) is _startup_nidaq
+    assert _find_startup(_stand_in(MICROMETER_KEY)) is _startup_micrometer
+
+
+def test_find_startup_subclass():
+    class WrappedPositionController(_stand_in(NIDAQ_KEY)):
+        pass
+
+    class WrappedMicrometer(_stand_in(MICROMETER_KEY)):
+        pass
+
+    assert _find_startup(WrappedPositionController) is _startup_nidaq
+    assert _find_startup(WrappedMicrometer) is _startup_micrometer
+
+
+def test_find_startup_unknown_type():
+    class OtherPositioner:
+        pass
+
+    assert _find_startup(OtherPositioner) is None